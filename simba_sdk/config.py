@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     CREDENTIAL_URL: str - The url to the credential service.
     RESOURCE_URL: str - The url to the resource service.
     SDK_ROOT: str - The root directory of the SDK, defaults to the folder this file is in.
+    MAX_INFLIGHT: int - How many requests the bulk_* client helpers keep in flight at once, 16 by default.
     """
 
     CLIENT_ID: str
@@ -34,6 +35,7 @@ class Settings(BaseSettings):
     TOKEN_URL: str
     CREDENTIAL_URL: str
     RESOURCE_URL: str
+    MAX_INFLIGHT: int = 16
 
 
 def load_settings(**kwargs: str) -> Settings:
@@ -4,7 +4,7 @@ import os.path
 import pathlib
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Union
+from typing import Awaitable, Dict, Optional, Union
 
 
 class BaseTokenStore(ABC):
@@ -15,16 +15,26 @@ class BaseTokenStore(ABC):
         """Checks if the defined token exists"""
 
     @abstractmethod
-    def is_expired_token(self, identifier: str) -> bool:
-        """Checks if the defined token has expired"""
+    def is_expired_token(self, identifier: str) -> Union[bool, Awaitable[bool]]:
+        """Checks if the defined token has expired.
+        Remote stores may return an awaitable, it is awaited by the caller
+        """
 
     @abstractmethod
-    def set_token(self, identifier: str, token: str, expires: int) -> None:
-        """Stores the token in the specified store type"""
+    def set_token(
+        self, identifier: str, token: str, expires: int
+    ) -> Optional[Awaitable[None]]:
+        """Stores the token in the specified store type.
+        Remote stores may return an awaitable, clients then finish the write in the background
+        """
 
     @abstractmethod
-    def get_token(self, identifier: str) -> Optional[str]:
-        """Fetches the stored token"""
+    def get_token(
+        self, identifier: str
+    ) -> Union[Optional[str], Awaitable[Optional[str]]]:
+        """Fetches the stored token.
+        Remote stores may return an awaitable, clients wait for any pending write to the store before reading
+        """
 
 
 class InMemoryTokenStore(BaseTokenStore):
@@ -1,38 +1,291 @@
-from types import TracebackType
-from typing import Dict, List, Optional
+import asyncio
+import importlib.util
+import inspect
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
+from types import MappingProxyType, TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlencode
 
 import httpx
 from httpx import Response
-from httpx._types import RequestFiles
+from httpx._types import QueryParamTypes, RequestContent, RequestFiles
+from pydantic import BaseModel
 from pydantic_core import Url
 from typing_extensions import Type
 
 from simba_sdk import config
 from simba_sdk.config import settings
 from simba_sdk.core.requests.auth.token_store import BaseTokenStore
-from simba_sdk.core.requests.exception import RequestException
-from simba_sdk.core.requests.middleware.manager import MiddlewareManager
+from simba_sdk.core.requests.exception import EnsureException, RequestException
+from simba_sdk.core.requests.middleware.manager import BaseMiddleware, MiddlewareManager
+from simba_sdk.core.requests.serialise import construct, loads
+
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs `h2` (pinned in requirements.txt), environments without it fall back to HTTP/1.1
+HTTP2_AVAILABLE: bool = importlib.util.find_spec("h2") is not None
+DEFAULT_LIMITS: httpx.Limits = httpx.Limits(
+    max_connections=100, max_keepalive_connections=50, keepalive_expiry=300
+)
+# an unreachable host should fail fast, independently of how long responses may take
+DEFAULT_CONNECT_TIMEOUT: float = 10.0
+# responses remembered per client for If-None-Match revalidation, see _cond_get
+_ETAG_CACHE_SIZE = 256
+
+T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_DEFAULT_CLIENTS: Dict[
+    asyncio.AbstractEventLoop, Dict[Tuple[Hashable, ...], httpx.AsyncClient]
+] = {}
+# asynchronous token store writes still in flight, keyed by the id of the store so every client sharing one
+# waits for them, stores need not be hashable
+_PENDING_WRITES: Dict[int, Set["asyncio.Future[None]"]] = {}
+
+
+def _new_client(
+    headers: Optional[Mapping[str, str]],
+    cookies: Optional[Mapping[str, str]],
+    timeout: Optional[float],
+    http2: bool,
+    limits: httpx.Limits,
+    retries: int = 0,
+    connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        headers=headers or None,
+        cookies=dict(cookies) if cookies else None,
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        transport=httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=retries),
+        follow_redirects=True,
+    )
+
+
+def _get_default_client(
+    loop: asyncio.AbstractEventLoop,
+    token_store: Optional[BaseTokenStore],
+    headers: Optional[Mapping[str, str]],
+    cookies: Optional[Mapping[str, str]],
+    timeout: Optional[float],
+    http2: bool,
+    limits: httpx.Limits,
+    retries: int = 0,
+    connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+) -> httpx.AsyncClient:
+    """
+    Get the shared `httpx.AsyncClient` for this event loop, token store and configuration, creating it on
+    first use. Clients built with the same settings share one connection pool and SSL context.
+    Pooled connections belong to the loop that opened them, and the cookie jar to whoever the server sees
+    through the token store, so neither is shared beyond them.
+    """
+    key = (
+        token_store,
+        frozenset(headers.items()) if headers else None,
+        frozenset(cookies.items()) if cookies else None,
+        timeout,
+        connect_timeout,
+        http2,
+        (
+            limits.max_connections,
+            limits.max_keepalive_connections,
+            limits.keepalive_expiry,
+        ),
+        retries,
+    )
+    clients = _DEFAULT_CLIENTS.get(loop)
+    if clients is None:
+        _drop_finished_loops()
+        clients = _DEFAULT_CLIENTS[loop] = {}
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = _new_client(
+            headers, cookies, timeout, http2, limits, retries, connect_timeout
+        )
+        clients[key] = client
+    return client
+
+
+def _drop_finished_loops() -> None:
+    # the clients of loops that have finished can neither be used nor closed any more
+    for loop in [loop for loop in _DEFAULT_CLIENTS if loop.is_closed()]:
+        del _DEFAULT_CLIENTS[loop]
+
+
+def _write_done(store_id: int, write: "asyncio.Future[None]") -> None:
+    pending = _PENDING_WRITES.get(store_id)
+    if pending is not None:
+        pending.discard(write)
+        if not pending:
+            del _PENDING_WRITES[store_id]
+    # failures are only reported here, the clients waiting on the write don't raise them
+    if not write.cancelled() and write.exception() is not None:
+        logger.error("Token store write failed", exc_info=write.exception())
+
+
+class _AsyncChunkReader:
+    """
+    The async file-like object ijson reads from, each read returns the next chunk of the response body.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            # ijson probes the return type with an empty read before parsing
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            # an empty read tells ijson the body is finished
+            return b""
+
+
+_FORM_HEADERS: Mapping[str, str] = MappingProxyType(
+    {"Content-Type": "application/x-www-form-urlencoded"}
+)
+# for request bodies that are already encoded as JSON and sent as `content`
+JSON_HEADERS: Mapping[str, str] = MappingProxyType({"Content-Type": "application/json"})
+
+
+@lru_cache(maxsize=4)
+def _bearer_headers(token: str) -> Mapping[str, str]:
+    # read-only, the same mapping is handed to every request using this token
+    return MappingProxyType({"Authorization": "Bearer " + token})
+
+
+async def close_default_clients() -> None:
+    """
+    Close the shared `httpx.AsyncClient`s of the running event loop, call this from your application's
+    shutdown hook. Those of loops that have already finished are dropped.
+    """
+    clients = _DEFAULT_CLIENTS.pop(asyncio.get_running_loop(), {})
+    _drop_finished_loops()
+    for client in clients.values():
+        await client.aclose()
 
 
 class Client:
+    """
+    Base client wrapping a pooled `httpx.AsyncClient`.
+    Unless `client` is passed, clients created in the same event loop with the same token store, headers,
+    cookies, timeout and pool settings share one `httpx.AsyncClient`, which is closed by `close_default_clients`.
+    A client created outside of an event loop gets its own `httpx.AsyncClient`, closed when it exits. Still,
+    create one client per service and reuse it, don't instantiate a `Client` inside a hot loop.
+
+    args:
+        http2: Multiplex requests over a single connection. Defaults to True when `h2` is installed, otherwise
+            requests are sent over HTTP/1.1. Passing True without `h2` installed raises an ImportError.
+        limits: Connection pool limits for the underlying `httpx.AsyncClient`.
+        validate_url: Fully parse `base_url` on construction, otherwise only the scheme separator is checked.
+        retries: How many times the transport retries a failed connection attempt. This only covers connect
+            errors, retrying on HTTP status codes is left to middleware.
+        trust_server: Build response models with `model_construct` instead of validating them. Faster for
+            large pages, but the data is taken as-is, e.g. datetimes and enums stay strings.
+        max_inflight: How many requests `gather` and `send_many` keep in flight at once, `settings.MAX_INFLIGHT`
+            by default.
+        connect_timeout: How long to wait for a connection to be established, `timeout` still applies to reading
+            and writing. None waits forever.
+    """
+
+    # the response models' compiled validators, bound on first use so _validate skips the Python-level wrappers
+    _validators: Dict[type, Callable[[bytes], Any]] = {}
+
     def __init__(
         self,
         base_url: str,
-        headers: Dict[str, str] = {},
-        cookies: Dict[str, str] = {},
+        headers: Optional[Mapping[str, str]] = None,
+        cookies: Optional[Mapping[str, str]] = None,
         client: Optional[httpx.AsyncClient] = None,
         timeout: Optional[float] = 100.0,
         token_store: Optional[BaseTokenStore] = None,
         middleware: Optional[List[str]] = None,
+        http2: Optional[bool] = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        validate_url: bool = False,
+        retries: int = 0,
+        trust_server: bool = False,
+        max_inflight: Optional[int] = None,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
     ):
-        Url(base_url)
+        if validate_url:
+            Url(base_url)
+        elif "://" not in base_url:
+            raise ValueError(f"Invalid base_url, expected an absolute URL: {base_url}")
         self._base_url = base_url
-        self._client: httpx.AsyncClient = (
-            httpx.AsyncClient(headers=headers, cookies=cookies, timeout=timeout)
-            if not client
-            else client
-        )
+        self._base_prefix = base_url.rstrip("/")
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        # the shared default client is left open on exit, it outlives this instance
+        self._shared_client = not client and loop is not None
+        self._client: httpx.AsyncClient
+        if client:
+            self._client = client
+        elif loop is not None:
+            self._client = _get_default_client(
+                loop,
+                token_store,
+                headers=headers,
+                cookies=cookies,
+                timeout=timeout,
+                http2=HTTP2_AVAILABLE if http2 is None else http2,
+                limits=limits,
+                retries=retries,
+                connect_timeout=connect_timeout,
+            )
+        else:
+            self._client = _new_client(
+                headers=headers,
+                cookies=cookies,
+                timeout=timeout,
+                http2=HTTP2_AVAILABLE if http2 is None else http2,
+                limits=limits,
+                retries=retries,
+                connect_timeout=connect_timeout,
+            )
+        self._transport: httpx.AsyncBaseTransport = self._client._transport
+        self._build_request = self._client.build_request
+        self._raw_send = self._client.send
         self.token_store = token_store
+        self._trust_server = trust_server
+        self._max_inflight = (
+            settings.MAX_INFLIGHT if max_inflight is None else max_inflight
+        )
+        # url -> (ETag, parsed response) of the last conditional GET, least recently used first
+        self._etags: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        # client credentials don't change, so the token request body is encoded once
+        self._auth_body: bytes = urlencode(
+            {
+                "grant_type": "client_credentials",
+                "client_id": settings.CLIENT_ID,
+                "client_secret": settings.CLIENT_SECRET,
+            }
+        ).encode()
 
         self.middleware_manager = MiddlewareManager()
         if middleware is not None:
@@ -45,9 +298,11 @@ class Client:
                 middleware_instance = config.MIDDLEWARE[ware]()
                 middleware_instance.client = self._client
                 self.middleware_manager.add_middleware(middleware_instance)
+        self._send_fn = self.middleware_manager.compile(self._client, self._transport)
 
     async def __aenter__(self) -> "Client":
-        await self._client.__aenter__()  # type: ignore
+        if not self._shared_client:
+            await self._client.__aenter__()  # type: ignore
         return self
 
     async def __aexit__(
@@ -56,25 +311,70 @@ class Client:
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        await self._client.__aexit__(exc_type, exc_val, exc_tb)  # type: ignore
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Wait for pending token store writes and close this client's own `httpx.AsyncClient`, for when the client
+        isn't used as a context manager. The shared default client is left open, see `close_default_clients`.
+        """
+        await self._await_writes()
+        if not self._shared_client:
+            await self._client.aclose()
+
+    def add_middleware(self, middleware: BaseMiddleware) -> None:
+        """
+        Register a middleware instance for all subsequent requests sent by this client.
+        """
+        middleware.client = self._client
+        self.middleware_manager.add_middleware(middleware)
+        self._send_fn = self.middleware_manager.compile(self._client, self._transport)
+
+    async def warmup(self, connections: int = 4, path: str = "/") -> None:
+        """
+        Open up to `connections` pooled connections to the service before the first real request, so it doesn't
+        pay for the TCP and TLS handshakes. This is opt-in, `authorise` does not call it. The HEAD requests are
+        sent without auth and any response or connection error is ignored, real requests still raise them.
+        Over HTTP/2 requests are multiplexed, so only one connection is opened.
+        """
+
+        async def open_one() -> None:
+            try:
+                resp = await self._raw_send(
+                    self._build_request("HEAD", self.build_url(path))
+                )
+                await resp.aclose()
+            except httpx.HTTPError:
+                pass
+
+        await asyncio.gather(*(open_one() for _ in range(connections)))
 
     def build_url(self, url: str) -> str:
-        if not url.startswith("/"):
-            url = "/" + url
+        return self._base_prefix + (url if url[:1] == "/" else "/" + url)
 
-        return self._base_url + url
+    async def _await_writes(self) -> None:
+        # writes started by any client sharing this token store, not just this one
+        pending = (
+            _PENDING_WRITES.get(id(self.token_store)) if self.token_store else None
+        )
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
-    def _get_token(self) -> Optional[str]:
+    async def _get_token(self) -> Optional[str]:
+        await self._await_writes()
         if self.token_store:
-            token: Optional[str] = self.token_store.get_token(settings.CLIENT_ID)
+            # the store is shared between clients, so it is still read every time
+            token = self.token_store.get_token(settings.CLIENT_ID)
+            if token is not None and not isinstance(token, str):
+                token = await token
             return token
         raise LookupError("No token_path store registered to this client")
 
     async def get(
         self,
         url: str,
-        params: Optional[Dict] = None,
-        headers: Optional[Dict] = None,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[Mapping] = None,
         cookies: Optional[Dict] = None,
     ) -> Response:
         return await self.send(
@@ -86,14 +386,21 @@ class Client:
         url: str,
         data: Optional[Dict[str, str]] = None,
         upload_file: Optional[RequestFiles] = None,
-        params: Optional[Dict] = None,
-        headers: Optional[Dict] = None,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[Mapping] = None,
         cookies: Optional[Dict] = None,
+        content: Optional[RequestContent] = None,
     ) -> Response:
-        if not upload_file and not data:
+        """
+        Pass `upload_file` values as open binary file objects rather than bytes, httpx then streams them
+        from disk in 64 KiB chunks instead of holding the whole file in memory.
+        Pass an already encoded body, e.g. JSON bytes, as `content` so httpx sends it as-is instead of
+        encoding `data` again.
+        """
+        if not upload_file and not data and content is None:
             raise RequestException(
                 status_code=400,
-                message="Post requests must either send an upload_file or data.",
+                message="Post requests must either send an upload_file, data or content.",
             )
         return await self.send(
             "POST",
@@ -103,6 +410,7 @@ class Client:
             params=params,
             headers=headers,
             cookies=cookies,
+            content=content,
         )
 
     async def put(
@@ -110,9 +418,10 @@ class Client:
         url: str,
         data: Optional[Dict[str, str]] = None,
         upload_file: Optional[RequestFiles] = None,
-        params: Optional[Dict] = None,
-        headers: Optional[Dict] = None,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[Mapping] = None,
         cookies: Optional[Dict] = None,
+        content: Optional[RequestContent] = None,
     ) -> Response:
         return await self.send(
             "PUT",
@@ -122,6 +431,7 @@ class Client:
             params=params,
             headers=headers,
             cookies=cookies,
+            content=content,
         )
 
     async def patch(
@@ -129,9 +439,10 @@ class Client:
         url: str,
         data: Optional[Dict[str, str]] = None,
         upload_file: Optional[RequestFiles] = None,
-        params: Optional[Dict] = None,
-        headers: Optional[Dict] = None,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[Mapping] = None,
         cookies: Optional[Dict] = None,
+        content: Optional[RequestContent] = None,
     ) -> Response:
         return await self.send(
             "PATCH",
@@ -141,87 +452,334 @@ class Client:
             params=params,
             headers=headers,
             cookies=cookies,
+            content=content,
         )
 
     async def delete(
         self,
         url: str,
-        params: Optional[Dict] = None,
-        headers: Optional[Dict] = None,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[Mapping] = None,
         cookies: Optional[Dict] = None,
     ) -> Response:
         return await self.send(
             "DELETE", url, params=params, headers=headers, cookies=cookies
         )
 
-    async def send(
+    def _prepare_request(
         self,
         method: str,
         url: str,
         data: Optional[Dict] = None,
         upload_file: Optional[RequestFiles] = None,
-        params: Optional[Dict] = None,
-        headers: Optional[Dict] = None,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[Mapping] = None,
         cookies: Optional[Dict] = None,
-    ) -> Response:
-        """
-        Send a request via the MiddlewareManager
-        """
-        if data is None:
-            data = {}
-        if cookies is None:
-            cookies = {}
-        if headers is None:
-            headers = {}
-        if params is None:
-            params = {}
-
-        token = self._get_token()
+        content: Optional[RequestContent] = None,
+        token: Optional[str] = None,
+    ) -> httpx.Request:
+        # httpx treats None as "nothing to send" for all of these, no need for empty dicts
         if token:
-            headers = {"Authorization": f"Bearer {token}"}
+            # only the header is cached per token
+            auth_header = _bearer_headers(token)
+            headers = {**headers, **auth_header} if headers else auth_header
 
-        request = self._client.build_request(
+        return self._build_request(
             method,
-            self.build_url(url),
+            self._base_prefix + (url if url[:1] == "/" else "/" + url),
             data=data,
             files=upload_file,
             params=params,
             headers=headers,
             cookies=cookies,
+            content=content,
         )
-        resp: Response = await self.middleware_manager.send(
-            request, self._client._transport
+
+    @staticmethod
+    def _unexpected_format(resp: Response) -> EnsureException:
+        """
+        The error for a response body that doesn't match its model. The body can be a whole page of records,
+        so it is only included when debug logging is enabled, otherwise just its size and content type are.
+        A streamed body has already been consumed, so only its content type is reported.
+        """
+        content_type = resp.headers.get("Content-Type", "unknown content type")
+        try:
+            content: Optional[bytes] = resp.content
+        except httpx.ResponseNotRead:
+            content = None
+        if content is None:
+            detail = f"streamed {content_type}"
+        elif logger.isEnabledFor(logging.DEBUG):
+            detail = content.decode(errors="replace")
+        else:
+            detail = f"{len(content)} bytes of {content_type}"
+        return EnsureException(
+            f"The response came back in an unexpected format: {detail}"
         )
+
+    def _validate(self, model: Type[ModelT], resp: Response) -> ModelT:
+        """
+        Parse a response body into `model`, or just build it when the client was created with `trust_server`.
+        """
+        try:
+            if self._trust_server:
+                return construct(model, loads(resp.content))
+            validate = self._validators.get(model)
+            if validate is None:
+                validate = self._validators[model] = (
+                    model.__pydantic_validator__.validate_json
+                )
+            return validate(resp.content)
+        except (ValueError, TypeError):
+            # ValidationError and JSON decode errors are both ValueErrors
+            raise self._unexpected_format(resp)
+
+    @classmethod
+    def _parse_json(cls, resp: Response) -> Any:
+        """
+        Parse the body of an endpoint that has no response model.
+        """
+        try:
+            return loads(resp.content)
+        except ValueError:
+            raise cls._unexpected_format(resp)
+
+    @classmethod
+    def _parse_str(cls, resp: Response) -> str:
+        """
+        Read an endpoint's plain string response. A JSON string without escapes is sliced out of the body rather
+        than parsed, anything else is parsed and converted with `str`.
+        """
+        content = resp.content
+        if (
+            len(content) >= 2
+            and content[:1] == b'"'
+            and content[-1:] == b'"'
+            and b"\\" not in content
+        ):
+            return content[1:-1].decode()
+        return str(cls._parse_json(resp))
+
+    @staticmethod
+    def _raise_for_status(resp: Response) -> None:
         if resp.status_code >= 300:
             try:
-                error = resp.json()["detail"]
-            except (KeyError, AttributeError):
+                error = loads(resp.content)["detail"]
+            except (ValueError, TypeError, KeyError):
                 error = resp.text
             raise RequestException(
                 status_code=resp.status_code,
                 message=f"Request was unsuccessful: {error}",
             )
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict] = None,
+        upload_file: Optional[RequestFiles] = None,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[Mapping] = None,
+        cookies: Optional[Dict] = None,
+        content: Optional[RequestContent] = None,
+    ) -> Response:
+        """
+        Send a request via the MiddlewareManager
+        """
+        request = self._prepare_request(
+            method,
+            url,
+            data,
+            upload_file,
+            params,
+            headers,
+            cookies,
+            content,
+            await self._get_token(),
+        )
+        resp: Response = await self._send_fn(request)
+        self._raise_for_status(resp)
         return resp
 
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict] = None,
+        upload_file: Optional[RequestFiles] = None,
+        params: Optional[QueryParamTypes] = None,
+        headers: Optional[Mapping] = None,
+        cookies: Optional[Dict] = None,
+        content: Optional[RequestContent] = None,
+    ) -> AsyncIterator[Response]:
+        """
+        Send a request without buffering the response body, read it with `aiter_bytes`/`aiter_lines` instead.
+        The connection is released when the context exits, see https://www.python-httpx.org/async/#streaming-responses
+        Streamed requests are sent straight to the AsyncClient, middleware only gets to `prepare` them, so the
+        URL is the same as `send` would build.
+        e.g.
+        ```
+        async with client.stream("GET", "/files/1/") as resp:
+            async for chunk in resp.aiter_bytes():
+                ...
+        ```
+        """
+        request = self._prepare_request(
+            method,
+            url,
+            data,
+            upload_file,
+            params,
+            headers,
+            cookies,
+            content,
+            await self._get_token(),
+        )
+        request = self.middleware_manager.prepare(request)
+        resp = await self._raw_send(request, stream=True)
+        try:
+            if resp.status_code >= 300:
+                await resp.aread()
+                self._raise_for_status(resp)
+            yield resp
+        finally:
+            await resp.aclose()
+
+    async def _iter_items(
+        self, url: str, params: Optional[QueryParamTypes] = None, key: str = "items"
+    ) -> AsyncIterator[Any]:
+        """
+        GET `url` and yield the objects in the response's `key` array as they arrive, without holding the whole
+        body in memory. Without `ijson` installed the body is buffered and parsed in one go instead.
+        A body that isn't JSON or has no `key` array raises an `EnsureException`, like the `list_*` methods.
+        """
+        if ijson is None:
+            # the response, and the body bytes it holds, are released before the first item is yielded
+            resp = await self.get(url, params=params)
+            try:
+                items = loads(resp.content)[key]
+            except (ValueError, TypeError, KeyError):
+                raise self._unexpected_format(resp)
+            if not isinstance(items, list):
+                raise self._unexpected_format(resp)
+            del resp
+            for item in items:
+                yield item
+            return
+        item_prefix = f"{key}.item"
+        async with self.stream("GET", url, params=params) as resp:
+            reader = _AsyncChunkReader(resp.aiter_bytes())
+            found = False
+            builder: Optional[Any] = None
+            depth = 0
+            try:
+                # ijson.items can't tell a missing array from an empty one, so items are built from the events
+                async for prefix, event, value in ijson.parse(reader, use_float=True):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if event in ("start_map", "start_array"):
+                            depth += 1
+                        elif event in ("end_map", "end_array"):
+                            depth -= 1
+                            if not depth:
+                                yield builder.value
+                                builder = None
+                    elif prefix == item_prefix:
+                        if event in ("start_map", "start_array"):
+                            builder = ijson.ObjectBuilder()
+                            builder.event(event, value)
+                            depth = 1
+                        else:
+                            yield value
+                    elif prefix == key and event == "start_array":
+                        found = True
+            except ijson.JSONError:
+                raise self._unexpected_format(resp)
+            if not found:
+                raise self._unexpected_format(resp)
+
+    async def _cond_get(self, url: str, parse: Callable[[Response], T]) -> T:
+        """
+        GET `url` and `parse` the response, revalidating the previous result with If-None-Match when the server
+        sent an ETag for it. On 304 Not Modified the cached result is returned as-is, the body isn't parsed again.
+        Meant for endpoints that are polled, e.g. tasks, where the answer usually hasn't changed.
+        The cached result is shared by every call that gets it back, so callers must not modify it.
+        """
+        cached = self._etags.get(url)
+        request = self._prepare_request(
+            "GET",
+            url,
+            headers={"If-None-Match": cached[0]} if cached else None,
+            token=await self._get_token(),
+        )
+        resp: Response = await self._send_fn(request)
+        # 304 is only a success for a request that asked for it
+        if resp.status_code == 304 and cached:
+            # concurrent calls may have evicted the entry while this one was in flight
+            self._remember_etag(url, cached)
+            return cached[1]
+        self._raise_for_status(resp)
+        result = parse(resp)
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._remember_etag(url, (etag, result))
+        else:
+            self._etags.pop(url, None)
+        return result
+
+    def _remember_etag(self, url: str, entry: Tuple[str, Any]) -> None:
+        self._etags[url] = entry
+        self._etags.move_to_end(url)
+        if len(self._etags) > _ETAG_CACHE_SIZE:
+            self._etags.popitem(last=False)
+
+    async def gather(
+        self, aws: Iterable[Awaitable[T]], concurrency: Optional[int] = None
+    ) -> List[T]:
+        """
+        Await several requests concurrently, with at most `concurrency` in flight at once.
+        args:
+            aws: the awaitables to run, e.g. calls to this client's endpoint methods.
+            concurrency: the maximum number of requests in flight, the client's `max_inflight` by default.
+                Throughput stops improving once this exceeds the connection pool (`limits.max_connections`
+                on HTTP/1.1) or the server's concurrent stream limit on HTTP/2, larger values only queue
+                requests inside httpx.
+        returns:
+            The results, in the same order as `aws`. The first failing request's exception is raised.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self._max_inflight)
+
+        async def run_one(aw: Awaitable[T]) -> T:
+            async with semaphore:
+                return await aw
+
+        return list(await asyncio.gather(*(run_one(aw) for aw in aws)))
+
+    async def send_many(
+        self, calls: Sequence[Dict[str, Any]], concurrency: Optional[int] = None
+    ) -> List[Response]:
+        """
+        Send several requests concurrently, see `gather`.
+        args:
+            calls: keyword arguments for `send`, one dict per request, e.g. `{"method": "GET", "url": "/dids/"}`.
+            concurrency: the maximum number of requests in flight, the client's `max_inflight` by default.
+        returns:
+            The responses, in the same order as `calls`. The first failing request's exception is raised.
+        """
+        return await self.gather((self.send(**call) for call in calls), concurrency)
+
     async def authorise(self, token_url: str, headers: Optional[Dict] = None) -> None:
         """
         Get an auth token_path via client credentials and store
         """
-        if headers is None:
-            headers = {}
-        request = self._client.build_request(
+        request = self._build_request(
             "POST",
             token_url,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": settings.CLIENT_ID,
-                "client_secret": settings.CLIENT_SECRET,
-            },
-            headers=headers,
-        )
-        resp: Response = await self.middleware_manager.send(
-            request, self._client._transport
+            content=self._auth_body,
+            headers={**_FORM_HEADERS, **headers} if headers else _FORM_HEADERS,
         )
+        resp: Response = await self._send_fn(request)
         if not resp.status_code == 200:
             raise RequestException(
                 status_code=resp.status_code,
@@ -229,8 +787,15 @@ class Client:
             )
         if not self.token_store:
             raise LookupError("No token_path store registered to this client")
-        self.token_store.set_token(
+        payload = loads(resp.content)
+        write = self.token_store.set_token(
             identifier=settings.CLIENT_ID,
-            token=resp.json()["access_token"],
-            expires=resp.json()["expires_at"],
+            token=payload["access_token"],
+            expires=payload["expires_at"],
         )
+        # synchronous stores are written inline, the token has to be readable as soon as this returns
+        if inspect.isawaitable(write):
+            pending = asyncio.ensure_future(write)
+            store_id = id(self.token_store)
+            _PENDING_WRITES.setdefault(store_id, set()).add(pending)
+            pending.add_done_callback(partial(_write_done, store_id))
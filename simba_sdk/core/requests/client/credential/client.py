@@ -1,14 +1,112 @@
-from dataclasses import asdict
-from typing import Any, Dict, Optional
-
-import pydantic_core
+import time
+from dataclasses import fields
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from urllib.parse import quote
+
+import httpx
 from pydantic import BaseModel
 
 from simba_sdk.config import settings
-from simba_sdk.core.requests.client.base import Client
+from simba_sdk.core.requests.client.base import JSON_HEADERS, Client
 from simba_sdk.core.requests.client.credential import queries as credential_queries
 from simba_sdk.core.requests.client.credential import schemas as credential_schemas
 from simba_sdk.core.requests.exception import EnsureException
+from simba_sdk.core.requests.serialise import construct, dump_model, dumps
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+# the most digests a client keeps cached when digest_ttl is set
+_DIGEST_CACHE_SIZE = 1024
+
+
+def _compile_query_params(cls: type) -> Callable[[Any], List[Tuple[str, Any]]]:
+    """
+    Generate the function that lists the (name, value) pairs of a query dataclass, one unrolled None check
+    per field instead of a generic walk over `fields()`. Lists and tuples give one pair per item, so the key
+    is repeated in the query string as httpx does for dicts.
+    """
+    lines = ["def query_params(q):", "    params = []"]
+    for field in fields(cls):
+        lines += [
+            f"    v = q.{field.name}",
+            "    if v is not None:",
+            "        if isinstance(v, (list, tuple)):",
+            f"            params += [({field.name!r}, i.value if isinstance(i, Enum) else i) for i in v]",
+            "        else:",
+            f"            params.append(({field.name!r}, v.value if isinstance(v, Enum) else v))",
+        ]
+    lines.append("    return params")
+    namespace: Dict[str, Any] = {"Enum": Enum}
+    exec("\n".join(lines), namespace)
+    return namespace["query_params"]
+
+
+def _query_params(query_arguments: Any) -> httpx.QueryParams:
+    """
+    Build the query string from the fields of a query dataclass that are not None, enum members are sent
+    by value. The function doing this is generated once per query class.
+    """
+    cls = type(query_arguments)
+    build = cls.__dict__.get("__query_params__")
+    if build is None:
+        build = _compile_query_params(cls)
+        cls.__query_params__ = build
+    return httpx.QueryParams(build(query_arguments))
+
+
+@lru_cache(maxsize=64)
+def _segment(value: str) -> str:
+    """
+    Percent-encode a value that goes into a URL path, so it can't change the shape of the URL. Cached, as the
+    same few domain names are used for almost every request.
+    """
+    return quote(value, safe="")
+
+
+def _accept_param(query_arguments: credential_queries.AcceptVcQuery) -> str:
+    # a missing value must not be sent as `accept=false`, which rejects the VC
+    if query_arguments.accept is None:
+        raise EnsureException("Field 'accept' is required.")
+    return "true" if query_arguments.accept else "false"
+
+
+# the response models' compiled validators, bound up front rather than on first use, see Client._validate
+_VALIDATORS: Dict[type, Callable[[bytes], Any]] = {
+    model: model.__pydantic_validator__.validate_json
+    for model in (
+        credential_schemas.User,
+        credential_schemas.DID,
+        credential_schemas.PendingTxn,
+        credential_schemas.PageVerifiableCredential,
+        credential_schemas.CredentialServiceDomainModelsVerifiableCredential,
+        credential_schemas.PageVerifiablePresentation,
+        credential_schemas.CredentialServiceDomainModelsVerifiablePresentation,
+        credential_schemas.PageTask,
+        credential_schemas.ProofDigest,
+        credential_schemas.VerificationResult,
+        credential_schemas.DIDDocument,
+        credential_schemas.ListAccounts,
+        credential_schemas.BlocksAccount,
+        credential_schemas.PageTrustProfile,
+        credential_schemas.TrustProfile,
+        credential_schemas.DomainRegistry,
+        credential_schemas.Task,
+        credential_schemas.PageDIDResponseModel,
+    )
+}
 
 
 class CredentialClient(Client):
@@ -20,13 +118,70 @@ class CredentialClient(Client):
     ```
     Clients are generated with methods that have a 1:1 relationship with endpoints on the service's API. You can find the models from the api in ./schemas.py
     and query models in ./queries.py
+
+    args:
+        digest_ttl: Cache the results of `get_vc_digest` and `get_vp_digest` for this many seconds, so retried
+            signing workflows don't fetch the same digest again. Off by default, see `invalidate_digest`.
     """
 
+    _validators = _VALIDATORS
+
+    def __init__(self, *args: Any, digest_ttl: Optional[float] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._digest_ttl = digest_ttl
+        # (kind, document id, domain) -> (expiry on the monotonic clock, digest), oldest first
+        self._digests: Dict[
+            Tuple[str, str, str], Tuple[float, credential_schemas.ProofDigest]
+        ] = {}
+
+    def _cached_digest(
+        self, key: Tuple[str, str, str]
+    ) -> Optional[credential_schemas.ProofDigest]:
+        entry = self._digests.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._digests[key]
+            return None
+        return entry[1]
+
+    def _store_digest(
+        self, key: Tuple[str, str, str], digest: credential_schemas.ProofDigest
+    ) -> None:
+        if self._digest_ttl:
+            if len(self._digests) >= _DIGEST_CACHE_SIZE:
+                # entries share one TTL, so the first one is the closest to expiring
+                del self._digests[next(iter(self._digests))]
+            self._digests[key] = (time.monotonic() + self._digest_ttl, digest)
+
+    def invalidate_digest(self, document_id: str, domain_name: str) -> None:
+        """
+        Drop the cached digests of a VC or VP, call this after changing it. Submitting a signed VC or VP through
+        this client already does.
+        """
+        self._digests.pop(("vc", document_id, domain_name), None)
+        self._digests.pop(("vp", document_id, domain_name), None)
+
     async def authorise(
         self, token_url: str = settings.TOKEN_URL, headers: Optional[Dict] = None
     ) -> None:
         await super().authorise(token_url, headers)
 
+    def _build(self, model: Type[ModelT], data: Any) -> ModelT:
+        # the per-item counterpart of _validate, for objects that have already been parsed
+        try:
+            if self._trust_server:
+                return construct(model, data)
+            return model.model_validate(data)
+        except (ValueError, TypeError):
+            # like _unexpected_format, an item can be large, so only its type and size are reported
+            detail = type(data).__name__
+            if isinstance(data, Sized):
+                detail += f" of length {len(data)}"
+            raise EnsureException(
+                f"The response came back in an unexpected format: {detail}"
+            )
+
     async def whoamai(
         self,
     ) -> credential_schemas.User:
@@ -34,16 +189,9 @@ class CredentialClient(Client):
         Shows how to get the currently logged-in user from the token
         """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/admin/whoami/", params=path_params)
+        resp = await self.get("/admin/whoami/")
 
-        try:
-            resp_model = credential_schemas.User.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.User, resp)
 
     async def admin_list_vcs(
         self,
@@ -104,26 +252,13 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/admin/domains/{domain_name}/vcs/", params=path_params | query_params
+            f"/admin/domains/{_segment(domain_name)}/vcs/", params=query_params
         )
 
-        try:
-            resp_model = credential_schemas.PageVerifiableCredential.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.PageVerifiableCredential, resp)
 
     async def admin_list_vps(
         self,
@@ -161,26 +296,13 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/admin/domains/{domain_name}/vps/", params=path_params | query_params
+            f"/admin/domains/{_segment(domain_name)}/vps/", params=query_params
         )
 
-        try:
-            resp_model = credential_schemas.PageVerifiablePresentation.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.PageVerifiablePresentation, resp)
 
     async def admin_list_tasks(
         self,
@@ -213,24 +335,13 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/admin/domains/{domain_name}/tasks/", params=path_params | query_params
+            f"/admin/domains/{_segment(domain_name)}/tasks/", params=query_params
         )
 
-        try:
-            resp_model = credential_schemas.PageTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.PageTask, resp)
 
     async def list_did_strings(
         self,
@@ -258,15 +369,11 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/dids/", params=path_params | query_params)
+        resp = await self.get("/dids/", params=query_params)
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_did_document(
         self,
@@ -291,22 +398,24 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {
-            "did_id": did_id,
-        }
-        resp = await self.get(f"/dids/{did_id}", params=path_params | query_params)
+        resp = await self.get(f"/dids/{did_id}", params=query_params)
 
-        try:
-            resp_model = credential_schemas.DIDDocument.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.DIDDocument, resp)
+
+    async def bulk_get_did_document(
+        self,
+        query_arguments: credential_queries.GetDidDocumentQuery,
+        did_ids: Iterable[str],
+    ) -> List[credential_schemas.DIDDocument]:
+        """
+        Get several DID documents concurrently, with at most `max_inflight` requests in flight.
+        Results are returned in the same order as `did_ids`.
+        """
+        return await self.gather(
+            self.get_did_document(query_arguments, did_id) for did_id in did_ids
+        )
 
     async def list_custodial_accounts(
         self,
@@ -327,20 +436,11 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/users/accounts/", params=path_params | query_params)
+        resp = await self.get("/users/accounts/", params=query_params)
 
-        try:
-            resp_model = credential_schemas.ListAccounts.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.ListAccounts, resp)
 
     async def create_custodial_account(
         self,
@@ -374,22 +474,13 @@ class CredentialClient(Client):
         - `models.BlocksAccount`: A blocks account object.
         """
 
-        path_params: Dict[str, Any] = {}
         resp = await self.post(
             "/users/accounts/",
-            data=str(createaccounthttp)
-            if not issubclass(type(createaccounthttp), BaseModel)
-            else createaccounthttp.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createaccounthttp),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = credential_schemas.BlocksAccount.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.BlocksAccount, resp)
 
     async def list_trust_profiles(
         self,
@@ -427,24 +518,13 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/domains/{domain_name}/trustprofiles/", params=path_params | query_params
+            f"/domains/{_segment(domain_name)}/trustprofiles/", params=query_params
         )
 
-        try:
-            resp_model = credential_schemas.PageTrustProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.PageTrustProfile, resp)
 
     async def create_trust_profile(
         self,
@@ -466,19 +546,13 @@ class CredentialClient(Client):
         - `DocumentId`: The MongoDB ObjectID of the newly created Document.
         """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
-            f"/domains/{domain_name}/trustprofiles/",
-            data=str(createtrustprofileinput)
-            if not issubclass(type(createtrustprofileinput), BaseModel)
-            else createtrustprofileinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/trustprofiles/",
+            content=dump_model(createtrustprofileinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_trust_profile(
         self,
@@ -498,21 +572,25 @@ class CredentialClient(Client):
         - A `TrustProfile`.
         """
 
-        path_params: Dict[str, Any] = {
-            "trustprofile": trustprofile,
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/domains/{domain_name}/trustprofiles/{trustprofile}", params=path_params
+            f"/domains/{_segment(domain_name)}/trustprofiles/{trustprofile}"
         )
 
-        try:
-            resp_model = credential_schemas.TrustProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.TrustProfile, resp)
+
+    async def bulk_get_trust_profile(
+        self,
+        trustprofiles: Iterable[str],
+        domain_name: str,
+    ) -> List[credential_schemas.TrustProfile]:
+        """
+        Get several TrustProfiles from one Domain concurrently, with at most `max_inflight` requests in flight.
+        Results are returned in the same order as `trustprofiles`.
+        """
+        return await self.gather(
+            self.get_trust_profile(trustprofile, domain_name)
+            for trustprofile in trustprofiles
+        )
 
     async def update_trust_profile(
         self,
@@ -535,20 +613,13 @@ class CredentialClient(Client):
         - `DocumentId` The MongoDB ObjectID of the updated Document.
         """
 
-        path_params: Dict[str, Any] = {
-            "trustprofile": trustprofile,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
-            f"/domains/{domain_name}/trustprofiles/{trustprofile}",
-            data=str(updatetrustprofileinput)
-            if not issubclass(type(updatetrustprofileinput), BaseModel)
-            else updatetrustprofileinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/trustprofiles/{trustprofile}",
+            content=dump_model(updatetrustprofileinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_schema_registry(
         self,
@@ -565,18 +636,9 @@ class CredentialClient(Client):
         Returns: `DomainRegistry`
         """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
-        resp = await self.get(f"/domains/{domain_name}/schemas/", params=path_params)
+        resp = await self.get(f"/domains/{_segment(domain_name)}/schemas/")
 
-        try:
-            resp_model = credential_schemas.DomainRegistry.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.DomainRegistry, resp)
 
     async def create_schema(
         self,
@@ -621,24 +683,13 @@ class CredentialClient(Client):
         ```
         """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
-            f"/domains/{domain_name}/schemas/",
-            data=str(createschemahttp)
-            if not issubclass(type(createschemahttp), BaseModel)
-            else createschemahttp.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/schemas/",
+            content=dump_model(createschemahttp),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = credential_schemas.Task.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.Task, resp)
 
     async def delete_schema(
         self,
@@ -658,21 +709,11 @@ class CredentialClient(Client):
         Returns: `models.Task`
         """
 
-        path_params: Dict[str, Any] = {
-            "schema_name": schema_name,
-            "domain_name": domain_name,
-        }
         resp = await self.delete(
-            f"/domains/{domain_name}/schemas/{schema_name}", params=path_params
+            f"/domains/{_segment(domain_name)}/schemas/{schema_name}"
         )
 
-        try:
-            resp_model = credential_schemas.Task.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.Task, resp)
 
     async def list_dids(
         self,
@@ -726,26 +767,28 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/domains/{domain_name}/dids/", params=path_params | query_params
+            f"/domains/{_segment(domain_name)}/dids/", params=query_params
         )
 
-        try:
-            resp_model = credential_schemas.PageDIDResponseModel.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.PageDIDResponseModel, resp)
+
+    async def iter_list_dids(
+        self,
+        query_arguments: credential_queries.ListDidsQuery,
+        domain_name: str,
+    ) -> AsyncIterator[credential_schemas.DIDResponseModel]:
+        """
+        Like `list_dids`, but yields the DIDs on the requested page as they are parsed, without building the
+        whole page in memory. Parsing is only incremental when `ijson` is installed.
+        """
+        async for item in self._iter_items(
+            f"/domains/{_segment(domain_name)}/dids/",
+            params=_query_params(query_arguments),
+        ):
+            yield self._build(credential_schemas.DIDResponseModel, item)
 
     async def create_did(
         self,
@@ -959,19 +1002,27 @@ class CredentialClient(Client):
         ```
         """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
-            f"/domains/{domain_name}/dids/",
-            data=str(createdidhttp)
-            if not issubclass(type(createdidhttp), BaseModel)
-            else createdidhttp.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/dids/",
+            content=dump_model(createdidhttp),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
+
+    async def bulk_create_did(
+        self,
+        domain_name: str,
+        createdidhttps: Iterable[credential_schemas.CreateDidHttp],
+    ) -> List[str]:
+        """
+        Create several DIDs in one Domain concurrently, with at most `max_inflight` requests in flight.
+        Returns the new Document IDs in the same order as `createdidhttps`.
+        """
+        return await self.gather(
+            self.create_did(domain_name, createdidhttp)
+            for createdidhttp in createdidhttps
+        )
 
     async def get_did(
         self,
@@ -990,21 +1041,9 @@ class CredentialClient(Client):
         - A `DID` model, see the OpenAPI schema section of this documentation.
         """
 
-        path_params: Dict[str, Any] = {
-            "did_id": did_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/domains/{domain_name}/dids/{did_id}", params=path_params
-        )
+        resp = await self.get(f"/domains/{_segment(domain_name)}/dids/{did_id}")
 
-        try:
-            resp_model = credential_schemas.DID.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.DID, resp)
 
     async def update_did(
         self,
@@ -1091,20 +1130,13 @@ class CredentialClient(Client):
         ```
         """
 
-        path_params: Dict[str, Any] = {
-            "did_id": did_id,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
-            f"/domains/{domain_name}/dids/{did_id}",
-            data=str(updatedidhttp)
-            if not issubclass(type(updatedidhttp), BaseModel)
-            else updatedidhttp.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/dids/{did_id}",
+            content=dump_model(updatedidhttp),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def revoke_did(
         self,
@@ -1125,16 +1157,9 @@ class CredentialClient(Client):
         - `ObjectID`: ID of the DID being revoked
         """
 
-        path_params: Dict[str, Any] = {
-            "did_id": did_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.delete(
-            f"/domains/{domain_name}/dids/{did_id}", params=path_params
-        )
+        resp = await self.delete(f"/domains/{_segment(domain_name)}/dids/{did_id}")
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def submit_signed_did_transaction(
         self,
@@ -1171,20 +1196,13 @@ class CredentialClient(Client):
         - `ObjectID`: ID of the DID being revoked
         """
 
-        path_params: Dict[str, Any] = {
-            "did_id": did_id,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
-            f"/domains/{domain_name}/dids/{did_id}/pending-txn/submit-signed/",
-            data=str(didsignedtxn)
-            if not issubclass(type(didsignedtxn), BaseModel)
-            else didsignedtxn.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/dids/{did_id}/pending-txn/submit-signed/",
+            content=dump_model(didsignedtxn),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_pending_did_txn(
         self,
@@ -1221,21 +1239,11 @@ class CredentialClient(Client):
                 ```
         """
 
-        path_params: Dict[str, Any] = {
-            "did_id": did_id,
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/domains/{domain_name}/dids/{did_id}/pending-txn/", params=path_params
+            f"/domains/{_segment(domain_name)}/dids/{did_id}/pending-txn/"
         )
 
-        try:
-            resp_model = credential_schemas.PendingTxn.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.PendingTxn, resp)
 
     async def delete_pending_did_txn(
         self,
@@ -1255,16 +1263,11 @@ class CredentialClient(Client):
         - `ObjectID`: ID of the DID whose pending txn is being deleted
         """
 
-        path_params: Dict[str, Any] = {
-            "did_id": did_id,
-            "domain_name": domain_name,
-        }
         resp = await self.delete(
-            f"/domains/{domain_name}/dids/{did_id}/pending-txn/", params=path_params
+            f"/domains/{_segment(domain_name)}/dids/{did_id}/pending-txn/"
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def list_vcs(
         self,
@@ -1318,26 +1321,33 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/domains/{domain_name}/vcs/", params=path_params | query_params
+            f"/domains/{_segment(domain_name)}/vcs/", params=query_params
         )
 
-        try:
-            resp_model = credential_schemas.PageVerifiableCredential.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
+        return self._validate(credential_schemas.PageVerifiableCredential, resp)
+
+    async def iter_vcs(
+        self,
+        query_arguments: credential_queries.ListVcsQuery,
+        domain_name: str,
+    ) -> AsyncIterator[
+        credential_schemas.CredentialServiceDomainModelsVerifiableCredential
+    ]:
+        """
+        Like `list_vcs`, but yields the VCs on the requested page as they are parsed, without building the
+        whole page in memory. Parsing is only incremental when `ijson` is installed.
+        """
+        async for item in self._iter_items(
+            f"/domains/{_segment(domain_name)}/vcs/",
+            params=_query_params(query_arguments),
+        ):
+            yield self._build(
+                credential_schemas.CredentialServiceDomainModelsVerifiableCredential,
+                item,
             )
-        return resp_model
 
     async def create_vc(
         self,
@@ -1484,19 +1494,26 @@ class CredentialClient(Client):
                 }
         """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
-            f"/domains/{domain_name}/vcs/",
-            data=str(createvchttp)
-            if not issubclass(type(createvchttp), BaseModel)
-            else createvchttp.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/vcs/",
+            content=dump_model(createvchttp),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
+
+    async def bulk_create_vc(
+        self,
+        domain_name: str,
+        createvchttps: Iterable[credential_schemas.CreateVCHttp],
+    ) -> List[str]:
+        """
+        Create several VCs in one Domain concurrently, with at most `max_inflight` requests in flight.
+        Returns the new Document IDs in the same order as `createvchttps`.
+        """
+        return await self.gather(
+            self.create_vc(domain_name, createvchttp) for createvchttp in createvchttps
+        )
 
     async def get_vc(
         self,
@@ -1515,21 +1532,11 @@ class CredentialClient(Client):
         - A `VC` model, see the OpenAPI schema section of this documentation.
         """
 
-        path_params: Dict[str, Any] = {
-            "vc_id": vc_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(f"/domains/{domain_name}/vcs/{vc_id}", params=path_params)
+        resp = await self.get(f"/domains/{_segment(domain_name)}/vcs/{vc_id}")
 
-        try:
-            resp_model = credential_schemas.CredentialServiceDomainModelsVerifiableCredential.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(
+            credential_schemas.CredentialServiceDomainModelsVerifiableCredential, resp
+        )
 
     async def revoke_vc(
         self,
@@ -1550,16 +1557,9 @@ class CredentialClient(Client):
         - `ObjectID`: ID of the VC that is being revoked
         """
 
-        path_params: Dict[str, Any] = {
-            "vc_id": vc_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.delete(
-            f"/domains/{domain_name}/vcs/{vc_id}", params=path_params
-        )
+        resp = await self.delete(f"/domains/{_segment(domain_name)}/vcs/{vc_id}")
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def accept_vc(
         self,
@@ -1582,22 +1582,29 @@ class CredentialClient(Client):
         - `DocumentId`: The MongoDB ObjectID of the updated VC.
         """
 
-        # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
-
-        path_params: Dict[str, Any] = {
-            "vc_id": vc_id,
-            "domain_name": domain_name,
-        }
+        # `accept` is the only parameter and is required, so the query string is written out directly
+        accept = _accept_param(query_arguments)
         resp = await self.put(
-            f"/domains/{domain_name}/vcs/{vc_id}/accept/",
-            params=path_params | query_params,
+            f"/domains/{_segment(domain_name)}/vcs/{vc_id}/accept/?accept={accept}"
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
+
+    async def bulk_accept_vc(
+        self,
+        query_arguments: credential_queries.AcceptVcQuery,
+        vc_ids: Iterable[str],
+        domain_name: str,
+    ) -> List[str]:
+        """
+        Accept several VCs in one Domain concurrently, with at most `max_inflight` requests in flight.
+        Results are returned in the same order as `vc_ids`.
+        """
+        # checked before any request is sent, rather than failing the batch part way through
+        _accept_param(query_arguments)
+        return await self.gather(
+            self.accept_vc(query_arguments, vc_id, domain_name) for vc_id in vc_ids
+        )
 
     async def submit_signed_vc_revocation(
         self,
@@ -1633,20 +1640,13 @@ class CredentialClient(Client):
         - `ObjectID`: ID of the VC that is being revoked
         """
 
-        path_params: Dict[str, Any] = {
-            "vc_id": vc_id,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
-            f"/domains/{domain_name}/vcs/revoked-vcs/{vc_id}/submit-signed/",
-            data=str(didsignedtxn)
-            if not issubclass(type(didsignedtxn), BaseModel)
-            else didsignedtxn.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/vcs/revoked-vcs/{vc_id}/submit-signed/",
+            content=dump_model(didsignedtxn),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def submit_signed_vc(
         self,
@@ -1670,20 +1670,14 @@ class CredentialClient(Client):
         - `DocumentId`: The MongoDB ObjectID of the signed VC.
         """
 
-        path_params: Dict[str, Any] = {
-            "vc_id": vc_id,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
-            f"/domains/{domain_name}/vcs/signed-vcs/{vc_id}/submit-signed/",
-            data=str(submitsignedcredentialhttp)
-            if not issubclass(type(submitsignedcredentialhttp), BaseModel)
-            else submitsignedcredentialhttp.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/vcs/signed-vcs/{vc_id}/submit-signed/",
+            content=dump_model(submitsignedcredentialhttp),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        self.invalidate_digest(vc_id, domain_name)
+        return self._parse_str(resp)
 
     async def get_pending_vc_txn(
         self,
@@ -1700,6 +1694,7 @@ class CredentialClient(Client):
 
         Returns:
         - `PendingTxn`: PendingTxn object that contains txn_id and raw_txn. raw_txn is what gets signed and then submitted to complete the DID update txn
+          While the transaction is unchanged the same object is returned to every call, copy it (`model_copy(deep=True)`) before modifying it.
 
             - Example:
 
@@ -1720,21 +1715,23 @@ class CredentialClient(Client):
                 ```
         """
 
-        path_params: Dict[str, Any] = {
-            "vc_id": vc_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/domains/{domain_name}/vcs/{vc_id}/pending-txn/", params=path_params
+        return await self._cond_get(
+            f"/domains/{_segment(domain_name)}/vcs/{vc_id}/pending-txn/",
+            lambda resp: self._validate(credential_schemas.PendingTxn, resp),
         )
 
-        try:
-            resp_model = credential_schemas.PendingTxn.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+    async def bulk_get_pending_vc_txn(
+        self,
+        vc_ids: Iterable[str],
+        domain_name: str,
+    ) -> List[credential_schemas.PendingTxn]:
+        """
+        Get the PENDING transactions of several VCs in one Domain concurrently, with at most `max_inflight`
+        requests in flight. Results are returned in the same order as `vc_ids`.
+        """
+        return await self.gather(
+            self.get_pending_vc_txn(vc_id, domain_name) for vc_id in vc_ids
+        )
 
     async def delete_pending_vc_txn(
         self,
@@ -1753,21 +1750,11 @@ class CredentialClient(Client):
         - `ObjectID`: ID of the VC that is being revoked
         """
 
-        path_params: Dict[str, Any] = {
-            "vc_id": vc_id,
-            "domain_name": domain_name,
-        }
         resp = await self.delete(
-            f"/domains/{domain_name}/vcs/{vc_id}/pending-txn/", params=path_params
+            f"/domains/{_segment(domain_name)}/vcs/{vc_id}/pending-txn/"
         )
 
-        try:
-            resp_model = credential_schemas.PendingTxn.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.PendingTxn, resp)
 
     async def get_vc_digest(
         self,
@@ -1788,21 +1775,16 @@ class CredentialClient(Client):
         - `ProofDigest`: object containing "digest" (bytes) property, which is what needs to be signed by private key
         """
 
-        path_params: Dict[str, Any] = {
-            "vc_id": vc_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/domains/{domain_name}/vcs/{vc_id}/digest/", params=path_params
-        )
+        key = ("vc", vc_id, domain_name)
+        cached = self._cached_digest(key)
+        if cached is not None:
+            return cached
 
-        try:
-            resp_model = credential_schemas.ProofDigest.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        resp = await self.get(f"/domains/{_segment(domain_name)}/vcs/{vc_id}/digest/")
+
+        digest = self._validate(credential_schemas.ProofDigest, resp)
+        self._store_digest(key, digest)
+        return digest
 
     async def get_vps(
         self,
@@ -1839,26 +1821,33 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/domains/{domain_name}/vps/", params=path_params | query_params
+            f"/domains/{_segment(domain_name)}/vps/", params=query_params
         )
 
-        try:
-            resp_model = credential_schemas.PageVerifiablePresentation.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
+        return self._validate(credential_schemas.PageVerifiablePresentation, resp)
+
+    async def iter_vps(
+        self,
+        query_arguments: credential_queries.GetVpsQuery,
+        domain_name: str,
+    ) -> AsyncIterator[
+        credential_schemas.CredentialServiceDomainModelsVerifiablePresentation
+    ]:
+        """
+        Like `get_vps`, but yields the VPs on the requested page as they are parsed, without building the
+        whole page in memory. Parsing is only incremental when `ijson` is installed.
+        """
+        async for item in self._iter_items(
+            f"/domains/{_segment(domain_name)}/vps/",
+            params=_query_params(query_arguments),
+        ):
+            yield self._build(
+                credential_schemas.CredentialServiceDomainModelsVerifiablePresentation,
+                item,
             )
-        return resp_model
 
     async def create_vp(
         self,
@@ -1909,19 +1898,13 @@ class CredentialClient(Client):
         ```
         """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
-            f"/domains/{domain_name}/vps/",
-            data=str(createvphttp)
-            if not issubclass(type(createvphttp), BaseModel)
-            else createvphttp.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/vps/",
+            content=dump_model(createvphttp),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_vp(
         self,
@@ -1940,21 +1923,11 @@ class CredentialClient(Client):
         - A `VP` model, see the OpenAPI schema section of this documentation.
         """
 
-        path_params: Dict[str, Any] = {
-            "vp_id": vp_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(f"/domains/{domain_name}/vps/{vp_id}", params=path_params)
+        resp = await self.get(f"/domains/{_segment(domain_name)}/vps/{vp_id}")
 
-        try:
-            resp_model = credential_schemas.CredentialServiceDomainModelsVerifiablePresentation.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(
+            credential_schemas.CredentialServiceDomainModelsVerifiablePresentation, resp
+        )
 
     async def submit_signed_vp(
         self,
@@ -1976,20 +1949,14 @@ class CredentialClient(Client):
         - `DocumentId`: The MongoDB ObjectID of the signed VP.
         """
 
-        path_params: Dict[str, Any] = {
-            "vp_id": vp_id,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
-            f"/domains/{domain_name}/vps/signed-vps/{vp_id}/submit-signed/",
-            data=str(submitsignedcredentialhttp)
-            if not issubclass(type(submitsignedcredentialhttp), BaseModel)
-            else submitsignedcredentialhttp.model_dump_json(),  # type: ignore
-            params=path_params,
+            f"/domains/{_segment(domain_name)}/vps/signed-vps/{vp_id}/submit-signed/",
+            content=dump_model(submitsignedcredentialhttp),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        self.invalidate_digest(vp_id, domain_name)
+        return self._parse_str(resp)
 
     async def get_vp_digest(
         self,
@@ -2010,21 +1977,16 @@ class CredentialClient(Client):
         - `ProofDigest`: object containing "digest" (bytes) property, which is what needs to be signed by private key
         """
 
-        path_params: Dict[str, Any] = {
-            "vp_id": vp_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/domains/{domain_name}/vps/{vp_id}/digest/", params=path_params
-        )
+        key = ("vp", vp_id, domain_name)
+        cached = self._cached_digest(key)
+        if cached is not None:
+            return cached
 
-        try:
-            resp_model = credential_schemas.ProofDigest.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        resp = await self.get(f"/domains/{_segment(domain_name)}/vps/{vp_id}/digest/")
+
+        digest = self._validate(credential_schemas.ProofDigest, resp)
+        self._store_digest(key, digest)
+        return digest
 
     async def list_tasks(
         self,
@@ -2055,24 +2017,28 @@ class CredentialClient(Client):
         """
 
         # get rid of items where None
-        query_params = {
-            k: v for k, v in asdict(query_arguments).items() if v is not None
-        }
+        query_params = _query_params(query_arguments)
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/domains/{domain_name}/tasks/", params=path_params | query_params
+            f"/domains/{_segment(domain_name)}/tasks/", params=query_params
         )
 
-        try:
-            resp_model = credential_schemas.PageTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.PageTask, resp)
+
+    async def iter_tasks(
+        self,
+        query_arguments: credential_queries.ListTasksQuery,
+        domain_name: str,
+    ) -> AsyncIterator[credential_schemas.Task]:
+        """
+        Like `list_tasks`, but yields the Tasks on the requested page as they are parsed, without building the
+        whole page in memory. Parsing is only incremental when `ijson` is installed.
+        """
+        async for item in self._iter_items(
+            f"/domains/{_segment(domain_name)}/tasks/",
+            params=_query_params(query_arguments),
+        ):
+            yield self._build(credential_schemas.Task, item)
 
     async def get_task(
         self,
@@ -2088,24 +2054,27 @@ class CredentialClient(Client):
         - `x_simba_sub_id`: Optional Member service id (UUID) for the user
 
         Returns:
-        - `Task`: a single task object which corresponds to the `task_id`
+        - `Task`: a single task object which corresponds to the `task_id`. While the task is unchanged the
+          same object is returned to every call, copy it (`model_copy(deep=True)`) before modifying it.
         """
 
-        path_params: Dict[str, Any] = {
-            "task_id": task_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/domains/{domain_name}/tasks/{task_id}", params=path_params
+        return await self._cond_get(
+            f"/domains/{_segment(domain_name)}/tasks/{task_id}",
+            lambda resp: self._validate(credential_schemas.Task, resp),
         )
 
-        try:
-            resp_model = credential_schemas.Task.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+    async def bulk_get_task(
+        self,
+        task_ids: Iterable[str],
+        domain_name: str,
+    ) -> List[credential_schemas.Task]:
+        """
+        Get several Tasks from one Domain concurrently, with at most `max_inflight` requests in flight, e.g. to
+        poll a batch of tasks in one round trip. Results are returned in the same order as `task_ids`.
+        """
+        return await self.gather(
+            self.get_task(task_id, domain_name) for task_id in task_ids
+        )
 
     async def verify_vc(
         self,
@@ -2116,30 +2085,15 @@ class CredentialClient(Client):
         This endpoint can be used to verify the integrity of a VerifiableCredential.
 
         Args:
-        - `vc`: A JSON_LD VerifiableCredential
+        - `vc`: A JSON_LD VerifiableCredential, as a dict, a model or JSON that is already serialised to `str` or `bytes`
 
         Returns:
         - A `VerificationResult` model, see the OpenAPI schema section of this documentation.
         """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.post(
-            "/verify/vc/",
-            data=str(body)
-            if not issubclass(type(body), BaseModel)
-            else body.model_dump_json(),  # type: ignore
-            params=path_params,
-        )
+        resp = await self.post("/verify/vc/", content=dumps(body), headers=JSON_HEADERS)
 
-        try:
-            resp_model = credential_schemas.VerificationResult.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.VerificationResult, resp)
 
     async def verify_vp(
         self,
@@ -2150,27 +2104,12 @@ class CredentialClient(Client):
         This endpoint can be used to verify the integrity of a VerifiablePresentation.
 
         Args:
-        - `vp`: A JSON_LD VerifiablePresentation
+        - `vp`: A JSON_LD VerifiablePresentation, as a dict, a model or JSON that is already serialised to `str` or `bytes`
 
         Returns:
         - A `VerificationResult` model, see the OpenAPI schema section of this documentation.
         """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.post(
-            "/verify/vp/",
-            data=str(body)
-            if not issubclass(type(body), BaseModel)
-            else body.model_dump_json(),  # type: ignore
-            params=path_params,
-        )
+        resp = await self.post("/verify/vp/", content=dumps(body), headers=JSON_HEADERS)
 
-        try:
-            resp_model = credential_schemas.VerificationResult.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(credential_schemas.VerificationResult, resp)
@@ -1,10 +1,16 @@
+import sys
 from dataclasses import dataclass
-from typing import Union
+from typing import Any, Dict, Union
 
 from simba_sdk.core.requests.client.credential import schemas as credential_schemas
 
+# query objects are built per call and only read, dataclass slots need python 3.10
+_QUERY_OPTIONS: Dict[str, Any] = (
+    {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+)
 
-@dataclass
+
+@dataclass(**_QUERY_OPTIONS)
 class AdminListVcsQuery:
     page: int
     size: int
@@ -37,7 +43,7 @@ class AdminListVcsQuery:
     credentialSubject__claim__fields: Union[str, None] = None
 
 
-@dataclass
+@dataclass(**_QUERY_OPTIONS)
 class AdminListVpsQuery:
     page: int
     size: int
@@ -62,7 +68,7 @@ class AdminListVpsQuery:
     credentialSubject__claim__fields: Union[str, None] = None
 
 
-@dataclass
+@dataclass(**_QUERY_OPTIONS)
 class AdminListTasksQuery:
     page: int
     size: int
@@ -77,7 +83,7 @@ class AdminListTasksQuery:
     updated_at__gte: Union[str, None] = None
 
 
-@dataclass
+@dataclass(**_QUERY_OPTIONS)
 class ListDidStringsQuery:
     page: int
     size: int
@@ -89,12 +95,12 @@ class ListDidStringsQuery:
     metadata__domain: Union[str, None] = None
 
 
-@dataclass
+@dataclass(**_QUERY_OPTIONS)
 class GetDidDocumentQuery:
     force_resolve: Union[bool, None] = None
 
 
-@dataclass
+@dataclass(**_QUERY_OPTIONS)
 class ListCustodialAccountsQuery:
     page: int
     size: int
@@ -102,7 +108,7 @@ class ListCustodialAccountsQuery:
     trust_profile: Union[str, None] = None
 
 
-@dataclass
+@dataclass(**_QUERY_OPTIONS)
 class ListTrustProfilesQuery:
     page: int
     size: int
@@ -116,7 +122,7 @@ class ListTrustProfilesQuery:
     cryptosuite: Union[str, None] = None
 
 
-@dataclass
+@dataclass(**_QUERY_OPTIONS)
 class ListDidsQuery:
     page: int
     size: int
@@ -145,7 +151,7 @@ class ListDidsQuery:
     did_document__controller: Union[str, None] = None
 
 
-@dataclass
+@dataclass(**_QUERY_OPTIONS)
 class ListVcsQuery:
     page: int
     size: int
@@ -178,7 +184,7 @@ class ListVcsQuery:
     credentialSubject__claim__fields: Union[str, None] = None
 
 
-@dataclass
+@dataclass(**_QUERY_OPTIONS)
 class AcceptVcQuery:
     accept: bool
 
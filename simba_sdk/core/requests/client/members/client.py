@@ -1,14 +1,11 @@
 from dataclasses import asdict
-from typing import Any, Dict, Optional, Union
-
-import pydantic_core
-from pydantic import BaseModel
+from typing import Dict, Optional, Union
 
 from simba_sdk.config import settings
-from simba_sdk.core.requests.client.base import Client
+from simba_sdk.core.requests.client.base import JSON_HEADERS, Client
 from simba_sdk.core.requests.client.members import queries as members_queries
 from simba_sdk.core.requests.client.members import schemas as members_schemas
-from simba_sdk.core.requests.exception import EnsureException
+from simba_sdk.core.requests.serialise import dump_model
 
 
 class MembersClient(Client):
@@ -32,8 +29,7 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {}
-        await self.get("/onboarding/invites/", params=path_params)
+        await self.get("/onboarding/invites/")
 
         return
 
@@ -42,8 +38,7 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {}
-        await self.get("/onboarding/invite_complete/", params=path_params)
+        await self.get("/onboarding/invite_complete/")
 
         return
 
@@ -59,23 +54,12 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/organisations/{organisation_name}/client_credentials/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = members_schemas.PageClientCredential.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageClientCredential, resp)
 
     async def create_client_credential(
         self,
@@ -84,26 +68,13 @@ class MembersClient(Client):
     ) -> members_schemas.FreshClientCredential:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/organisations/{organisation_name}/client_credentials/",
-            data=str(createclientcredentialinput)
-            if not issubclass(type(createclientcredentialinput), BaseModel)
-            else createclientcredentialinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createclientcredentialinput),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = members_schemas.FreshClientCredential.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.FreshClientCredential, resp)
 
     async def get_client_credential(
         self,
@@ -112,22 +83,11 @@ class MembersClient(Client):
     ) -> members_schemas.ClientCredential:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-            "client_id": client_id,
-        }
         resp = await self.get(
             f"/organisations/{organisation_name}/client_credentials/{client_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = members_schemas.ClientCredential.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.ClientCredential, resp)
 
     async def update_client_credential(
         self,
@@ -137,20 +97,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-            "client_id": client_id,
-        }
         resp = await self.put(
             f"/organisations/{organisation_name}/client_credentials/{client_id}",
-            data=str(updateclientcredentialinput)
-            if not issubclass(type(updateclientcredentialinput), BaseModel)
-            else updateclientcredentialinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updateclientcredentialinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def revoke_client_credential(
         self,
@@ -159,13 +112,8 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-            "client_id": client_id,
-        }
         await self.delete(
             f"/organisations/{organisation_name}/client_credentials/{client_id}",
-            params=path_params,
         )
 
         return
@@ -178,20 +126,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-            "client_id": client_id,
-        }
         resp = await self.put(
             f"/organisations/{organisation_name}/client_credentials/{client_id}/roles/",
-            data=str(updateidentityrolesinput)
-            if not issubclass(type(updateidentityrolesinput), BaseModel)
-            else updateidentityrolesinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updateidentityrolesinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def add_organisation_client_credential_roles(
         self,
@@ -201,20 +142,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-            "client_id": client_id,
-        }
         resp = await self.post(
             f"/organisations/{organisation_name}/client_credentials/{client_id}/roles/add/",
-            data=str(addidentityrolesinput)
-            if not issubclass(type(addidentityrolesinput), BaseModel)
-            else addidentityrolesinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(addidentityrolesinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def remove_organisation_client_credential_roles(
         self,
@@ -223,17 +157,11 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-            "client_id": client_id,
-        }
         resp = await self.delete(
             f"/organisations/{organisation_name}/client_credentials/{client_id}/roles/remove/",
-            params=path_params,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_user_client_credentials(
         self,
@@ -247,23 +175,12 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-        }
         resp = await self.get(
             f"/user_accounts/{user_account_id}/client_credentials/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = members_schemas.PageClientCredential.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageClientCredential, resp)
 
     async def create_impersonate_user_client_credentials(
         self,
@@ -272,26 +189,13 @@ class MembersClient(Client):
     ) -> members_schemas.FreshClientCredential:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-        }
         resp = await self.post(
             f"/user_accounts/{user_account_id}/client_credentials/",
-            data=str(createclientcredentialinput)
-            if not issubclass(type(createclientcredentialinput), BaseModel)
-            else createclientcredentialinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createclientcredentialinput),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = members_schemas.FreshClientCredential.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.FreshClientCredential, resp)
 
     async def get_user_client_credential(
         self,
@@ -300,22 +204,11 @@ class MembersClient(Client):
     ) -> members_schemas.ClientCredential:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-            "client_id": client_id,
-        }
         resp = await self.get(
             f"/user_accounts/{user_account_id}/client_credentials/{client_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = members_schemas.ClientCredential.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.ClientCredential, resp)
 
     async def update_user_client_credential(
         self,
@@ -325,20 +218,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-            "client_id": client_id,
-        }
         resp = await self.put(
             f"/user_accounts/{user_account_id}/client_credentials/{client_id}",
-            data=str(updateclientcredentialinput)
-            if not issubclass(type(updateclientcredentialinput), BaseModel)
-            else updateclientcredentialinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updateclientcredentialinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def revoke_user_client_credential(
         self,
@@ -347,13 +233,8 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-            "client_id": client_id,
-        }
         await self.delete(
             f"/user_accounts/{user_account_id}/client_credentials/{client_id}",
-            params=path_params,
         )
 
         return
@@ -369,16 +250,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/organisations/", params=path_params | query_params)
+        resp = await self.get("/organisations/", params=query_params)
 
-        try:
-            resp_model = members_schemas.PageOrganisation.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageOrganisation, resp)
 
     async def create_organisation(
         self,
@@ -386,17 +260,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {}
         resp = await self.post(
             "/organisations/",
-            data=str(createorganisationinput)
-            if not issubclass(type(createorganisationinput), BaseModel)
-            else createorganisationinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createorganisationinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_organisation_by_id(
         self,
@@ -404,18 +274,9 @@ class MembersClient(Client):
     ) -> members_schemas.Organisation:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_id": organisation_id,
-        }
-        resp = await self.get(f"/organisations/{organisation_id}", params=path_params)
+        resp = await self.get(f"/organisations/{organisation_id}")
 
-        try:
-            resp_model = members_schemas.Organisation.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.Organisation, resp)
 
     async def update_organisation(
         self,
@@ -424,19 +285,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_id": organisation_id,
-        }
         resp = await self.put(
             f"/organisations/{organisation_id}",
-            data=str(updateorganisationinput)
-            if not issubclass(type(updateorganisationinput), BaseModel)
-            else updateorganisationinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updateorganisationinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def remove_user_from_organisation(
         self,
@@ -445,13 +300,7 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_id": user_id,
-            "organisation_id": organisation_id,
-        }
-        await self.delete(
-            f"/organisations/{organisation_id}/users/{user_id}", params=path_params
-        )
+        await self.delete(f"/organisations/{organisation_id}/users/{user_id}")
 
         return
 
@@ -461,13 +310,10 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {}
         await self.post(
             "/organisation-input-checks/",
-            data=str(organisationname)
-            if not issubclass(type(organisationname), BaseModel)
-            else organisationname.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(organisationname),
+            headers=JSON_HEADERS,
         )
 
         return
@@ -483,16 +329,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/domains/", params=path_params | query_params)
+        resp = await self.get("/domains/", params=query_params)
 
-        try:
-            resp_model = members_schemas.PageDomain.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageDomain, resp)
 
     async def create_domain(
         self,
@@ -500,17 +339,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {}
         resp = await self.post(
             "/domains/",
-            data=str(createdomaininput)
-            if not issubclass(type(createdomaininput), BaseModel)
-            else createdomaininput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createdomaininput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_domain_by_id(
         self,
@@ -518,18 +353,9 @@ class MembersClient(Client):
     ) -> members_schemas.Domain:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_id": domain_id,
-        }
-        resp = await self.get(f"/domains/{domain_id}", params=path_params)
+        resp = await self.get(f"/domains/{domain_id}")
 
-        try:
-            resp_model = members_schemas.Domain.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.Domain, resp)
 
     async def update_domain(
         self,
@@ -538,19 +364,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_id": domain_id,
-        }
         resp = await self.put(
             f"/domains/{domain_id}",
-            data=str(updatedomaininput)
-            if not issubclass(type(updatedomaininput), BaseModel)
-            else updatedomaininput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatedomaininput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def add_domain_organisation(
         self,
@@ -559,19 +379,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
             f"/domains/{domain_name}/organisations/",
-            data=str(adddomainorganisationinput)
-            if not issubclass(type(adddomainorganisationinput), BaseModel)
-            else adddomainorganisationinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(adddomainorganisationinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def remove_domain_organisation(
         self,
@@ -579,15 +393,9 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
-        resp = await self.delete(
-            f"/domains/{domain_name}/organisations/", params=path_params
-        )
+        resp = await self.delete(f"/domains/{domain_name}/organisations/")
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def republish_events(
         self,
@@ -595,13 +403,10 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {}
         await self.post(
             "/republish_events/",
-            data=str(republisheventsinput)
-            if not issubclass(type(republisheventsinput), BaseModel)
-            else republisheventsinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(republisheventsinput),
+            headers=JSON_HEADERS,
         )
 
         return
@@ -612,13 +417,10 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {}
         await self.post(
             "/domain-input-checks/",
-            data=str(organisationname)
-            if not issubclass(type(organisationname), BaseModel)
-            else organisationname.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(organisationname),
+            headers=JSON_HEADERS,
         )
 
         return
@@ -634,16 +436,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/permissions/", params=path_params | query_params)
+        resp = await self.get("/permissions/", params=query_params)
 
-        try:
-            resp_model = members_schemas.PagePermission.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PagePermission, resp)
 
     async def create_permission(
         self,
@@ -651,17 +446,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {}
         resp = await self.post(
             "/permissions/",
-            data=str(createpermissioninput)
-            if not issubclass(type(createpermissioninput), BaseModel)
-            else createpermissioninput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createpermissioninput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_permission(
         self,
@@ -669,18 +460,9 @@ class MembersClient(Client):
     ) -> members_schemas.Permission:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "permission_id": permission_id,
-        }
-        resp = await self.get(f"/permissions/{permission_id}", params=path_params)
+        resp = await self.get(f"/permissions/{permission_id}")
 
-        try:
-            resp_model = members_schemas.Permission.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.Permission, resp)
 
     async def update_permission(
         self,
@@ -689,19 +471,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "permission_id": permission_id,
-        }
         resp = await self.put(
             f"/permissions/{permission_id}",
-            data=str(updatepermissioninput)
-            if not issubclass(type(updatepermissioninput), BaseModel)
-            else updatepermissioninput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatepermissioninput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_identities_permissions(
         self,
@@ -714,20 +490,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get(
-            "/identity_permissions/", params=path_params | query_params
-        )
+        resp = await self.get("/identity_permissions/", params=query_params)
 
-        try:
-            resp_model = members_schemas.GetIdentityPermissions.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.GetIdentityPermissions, resp)
 
     async def get_user_permissions(
         self,
@@ -740,18 +505,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/users_permissions/", params=path_params | query_params)
+        resp = await self.get("/users_permissions/", params=query_params)
 
-        try:
-            resp_model = members_schemas.GetIdentityPermissions.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.GetIdentityPermissions, resp)
 
     async def get_client_creds_permissions(
         self,
@@ -764,20 +520,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get(
-            "/clientcredentials_permissions/", params=path_params | query_params
-        )
+        resp = await self.get("/clientcredentials_permissions/", params=query_params)
 
-        try:
-            resp_model = members_schemas.GetIdentityPermissions.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.GetIdentityPermissions, resp)
 
     async def sync_permission(
         self,
@@ -785,13 +530,10 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {}
         await self.post(
             "/sync_permissions/",
-            data=str(syncservicepermissions)
-            if not issubclass(type(syncservicepermissions), BaseModel)
-            else syncservicepermissions.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(syncservicepermissions),
+            headers=JSON_HEADERS,
         )
 
         return
@@ -807,16 +549,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/roles/", params=path_params | query_params)
+        resp = await self.get("/roles/", params=query_params)
 
-        try:
-            resp_model = members_schemas.PageRoleWithFlags.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageRoleWithFlags, resp)
 
     async def get_role(
         self,
@@ -824,18 +559,9 @@ class MembersClient(Client):
     ) -> members_schemas.Role:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "role_id": role_id,
-        }
-        resp = await self.get(f"/roles/{role_id}", params=path_params)
+        resp = await self.get(f"/roles/{role_id}")
 
-        try:
-            resp_model = members_schemas.Role.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.Role, resp)
 
     async def get_templates(
         self,
@@ -848,16 +574,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/templates/", params=path_params | query_params)
+        resp = await self.get("/templates/", params=query_params)
 
-        try:
-            resp_model = members_schemas.PageTemplate.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageTemplate, resp)
 
     async def create_template(
         self,
@@ -865,17 +584,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {}
         resp = await self.post(
             "/templates/",
-            data=str(createtemplateinput)
-            if not issubclass(type(createtemplateinput), BaseModel)
-            else createtemplateinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createtemplateinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_template(
         self,
@@ -883,18 +598,9 @@ class MembersClient(Client):
     ) -> members_schemas.Template:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "template_id": template_id,
-        }
-        resp = await self.get(f"/templates/{template_id}", params=path_params)
+        resp = await self.get(f"/templates/{template_id}")
 
-        try:
-            resp_model = members_schemas.Template.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.Template, resp)
 
     async def update_template(
         self,
@@ -903,19 +609,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "template_id": template_id,
-        }
         resp = await self.put(
             f"/templates/{template_id}",
-            data=str(updatetemplateinput)
-            if not issubclass(type(updatetemplateinput), BaseModel)
-            else updatetemplateinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatetemplateinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_user_accounts(
         self,
@@ -928,20 +628,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/user_accounts/", params=path_params | query_params)
+        resp = await self.get("/user_accounts/", params=query_params)
 
-        try:
-            resp_model = (
-                members_schemas.PageUserAccountWithoutOrganisations.model_validate(
-                    resp.json()
-                )
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageUserAccountWithoutOrganisations, resp)
 
     async def get_user_account(
         self,
@@ -949,18 +638,9 @@ class MembersClient(Client):
     ) -> members_schemas.UserAccount:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-        }
-        resp = await self.get(f"/user_accounts/{user_account_id}", params=path_params)
+        resp = await self.get(f"/user_accounts/{user_account_id}")
 
-        try:
-            resp_model = members_schemas.UserAccount.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.UserAccount, resp)
 
     async def update_account(
         self,
@@ -969,19 +649,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-        }
         resp = await self.put(
             f"/user_accounts/{user_account_id}",
-            data=str(updateuseraccountinput)
-            if not issubclass(type(updateuseraccountinput), BaseModel)
-            else updateuseraccountinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updateuseraccountinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def delete_account(
         self,
@@ -989,31 +663,18 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-        }
-        resp = await self.delete(
-            f"/user_accounts/{user_account_id}", params=path_params
-        )
+        resp = await self.delete(f"/user_accounts/{user_account_id}")
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def whoami(
         self,
     ) -> members_schemas.UserAccount:
         """ """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/user_accounts/whoami/", params=path_params)
+        resp = await self.get("/user_accounts/whoami/")
 
-        try:
-            resp_model = members_schemas.UserAccount.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.UserAccount, resp)
 
     async def get_user_profile(
         self,
@@ -1022,22 +683,11 @@ class MembersClient(Client):
     ) -> members_schemas.UserProfile:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-            "profile_id": profile_id,
-        }
         resp = await self.get(
             f"/user_accounts/{user_account_id}/user_profiles/{profile_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = members_schemas.UserProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.UserProfile, resp)
 
     async def update_profile(
         self,
@@ -1047,20 +697,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-            "profile_id": profile_id,
-        }
         resp = await self.put(
             f"/user_accounts/{user_account_id}/user_profiles/{profile_id}",
-            data=str(updateuserprofileinput)
-            if not issubclass(type(updateuserprofileinput), BaseModel)
-            else updateuserprofileinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updateuserprofileinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_bulk_users_import_requests(
         self,
@@ -1073,20 +716,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get(
-            "/bulk-users-import-requests/", params=path_params | query_params
-        )
+        resp = await self.get("/bulk-users-import-requests/", params=query_params)
 
-        try:
-            resp_model = members_schemas.PageBulkUsersImportRequest.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageBulkUsersImportRequest, resp)
 
     async def create_bulk_users_import_request(
         self,
@@ -1149,15 +781,12 @@ class MembersClient(Client):
             - **6th column**: The system type - Specifies the system the users belong to. values: 'build' or 'ensure'
         """
 
-        upload_file = {"files": open(file_url, "rb")}
-
-        path_params: Dict[str, Any] = {}
-        resp = await self.post(
-            "/bulk-users-import-requests/", upload_file=upload_file, params=path_params
-        )
+        with open(file_url, "rb") as upload:
+            resp = await self.post(
+                "/bulk-users-import-requests/", upload_file={"files": upload}
+            )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_bulk_users_import_request(
         self,
@@ -1165,23 +794,11 @@ class MembersClient(Client):
     ) -> members_schemas.BulkUsersImportRequest:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "bulk_users_import_request_id": bulk_users_import_request_id,
-        }
         resp = await self.get(
             f"/bulk-users-import-requests/{bulk_users_import_request_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = members_schemas.BulkUsersImportRequest.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.BulkUsersImportRequest, resp)
 
     async def update_organisation_user_account_roles(
         self,
@@ -1191,20 +808,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-            "user_account_id": user_account_id,
-        }
         resp = await self.put(
             f"/organisations/{organisation_name}/users/{user_account_id}/roles/",
-            data=str(updateidentityrolesinput)
-            if not issubclass(type(updateidentityrolesinput), BaseModel)
-            else updateidentityrolesinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updateidentityrolesinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def add_organisation_user_account_roles(
         self,
@@ -1214,20 +824,13 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-            "user_account_id": user_account_id,
-        }
         resp = await self.post(
             f"/organisations/{organisation_name}/users/{user_account_id}/roles/add/",
-            data=str(addidentityrolesinput)
-            if not issubclass(type(addidentityrolesinput), BaseModel)
-            else addidentityrolesinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(addidentityrolesinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def remove_organisation_user_account_roles(
         self,
@@ -1236,17 +839,11 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-            "user_account_id": user_account_id,
-        }
         resp = await self.delete(
             f"/organisations/{organisation_name}/users/{user_account_id}/roles/remove/",
-            params=path_params,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_organisation_users(
         self,
@@ -1260,25 +857,12 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/organisations/{organisation_name}/users/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = (
-                members_schemas.PageUserAccountWithoutOrganisations.model_validate(
-                    resp.json()
-                )
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageUserAccountWithoutOrganisations, resp)
 
     async def admin_add_user_to_org_domain(
         self,
@@ -1344,19 +928,13 @@ class MembersClient(Client):
            - id -UUID of the user.
         """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/organisations/{organisation_name}/users/",
-            data=str(adminaddusertoorgdomain)
-            if not issubclass(type(adminaddusertoorgdomain), BaseModel)
-            else adminaddusertoorgdomain.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(adminaddusertoorgdomain),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_organisation_user(
         self,
@@ -1365,24 +943,11 @@ class MembersClient(Client):
     ) -> members_schemas.OrgScopedUserAccount:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "user_account_id": user_account_id,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/organisations/{organisation_name}/users/{user_account_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = members_schemas.OrgScopedUserAccount.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.OrgScopedUserAccount, resp)
 
     async def get_user_invites(
         self,
@@ -1395,16 +960,9 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/invites/", params=path_params | query_params)
+        resp = await self.get("/invites/", params=query_params)
 
-        try:
-            resp_model = members_schemas.PageInvite.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageInvite, resp)
 
     async def get_invite_info(
         self,
@@ -1412,18 +970,9 @@ class MembersClient(Client):
     ) -> members_schemas.InviteInfo:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "invite_id": invite_id,
-        }
-        resp = await self.get(f"/invites/{invite_id}", params=path_params)
+        resp = await self.get(f"/invites/{invite_id}")
 
-        try:
-            resp_model = members_schemas.InviteInfo.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.InviteInfo, resp)
 
     async def get_organisation_invites(
         self,
@@ -1437,21 +986,12 @@ class MembersClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/organisations/{organisation_name}/invites/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = members_schemas.PageInvite.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.PageInvite, resp)
 
     async def create_organisation_invite(
         self,
@@ -1525,18 +1065,13 @@ class MembersClient(Client):
          - List of ids (UUIDs) of the newly created invites.
         """
 
-        path_params: Dict[str, Any] = {
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/organisations/{organisation_name}/invites/",
-            data=str(createbulkinviteinput)
-            if not issubclass(type(createbulkinviteinput), BaseModel)
-            else createbulkinviteinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createbulkinviteinput),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = list(resp.json())  # type: ignore
+        resp_model = list(self._parse_json(resp))  # type: ignore
         return resp_model
 
     async def resend_user_invite(
@@ -1546,17 +1081,11 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "invite_id": invite_id,
-            "organisation_name": organisation_name,
-        }
         resp = await self.patch(
             f"/organisations/{organisation_name}/invites/{invite_id}/resend/",
-            params=path_params,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_organisation_invite(
         self,
@@ -1565,22 +1094,11 @@ class MembersClient(Client):
     ) -> members_schemas.Invite:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "invite_id": invite_id,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/organisations/{organisation_name}/invites/{invite_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = members_schemas.Invite.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.Invite, resp)
 
     async def revoke_organisation_invite(
         self,
@@ -1589,13 +1107,8 @@ class MembersClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "invite_id": invite_id,
-            "organisation_name": organisation_name,
-        }
         await self.delete(
             f"/organisations/{organisation_name}/invites/{invite_id}",
-            params=path_params,
         )
 
         return
@@ -1606,15 +1119,9 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "invite_id": invite_id,
-        }
-        resp = await self.put(
-            f"/invites/{invite_id}/accept-existing/", params=path_params
-        )
+        resp = await self.put(f"/invites/{invite_id}/accept-existing/")
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def accept_new_user_invite(
         self,
@@ -1623,32 +1130,19 @@ class MembersClient(Client):
     ) -> str:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "invite_id": invite_id,
-        }
         resp = await self.put(
             f"/invites/{invite_id}/accept-new/",
-            data=str(userinputbase)
-            if not issubclass(type(userinputbase), BaseModel)
-            else userinputbase.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(userinputbase),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_version(
         self,
     ) -> members_schemas.Version:
         """ """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/version/", params=path_params)
+        resp = await self.get("/version/")
 
-        try:
-            resp_model = members_schemas.Version.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(members_schemas.Version, resp)
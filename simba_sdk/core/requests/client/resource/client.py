@@ -1,14 +1,11 @@
 from dataclasses import asdict
-from typing import Any, Dict, Optional, Union
-
-import pydantic_core
-from pydantic import BaseModel
+from typing import Dict, Optional, Union
 
 from simba_sdk.config import settings
-from simba_sdk.core.requests.client.base import Client
+from simba_sdk.core.requests.client.base import JSON_HEADERS, Client
 from simba_sdk.core.requests.client.resource import queries as resource_queries
 from simba_sdk.core.requests.client.resource import schemas as resource_schemas
-from simba_sdk.core.requests.exception import EnsureException
+from simba_sdk.core.requests.serialise import dump_model, dumps
 
 
 class ResourceClient(Client):
@@ -39,21 +36,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/bundles/profiles/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageBundleProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageBundleProfile, resp)
 
     async def create_bundle_profile(
         self,
@@ -62,24 +50,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleProfile:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/bundles/profiles/",
-            data=str(bundleprofilerequest)
-            if not issubclass(type(bundleprofilerequest), BaseModel)
-            else bundleprofilerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(bundleprofilerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleProfile, resp)
 
     async def get_bundle_profile(
         self,
@@ -90,13 +67,8 @@ class ResourceClient(Client):
         Gets a bundle by its database UUID
         """
 
-        path_params: Dict[str, Any] = {
-            "profile_id": profile_id,
-            "domain_name": domain_name,
-        }
         await self.get(
             f"/v1/domains/{domain_name}/bundles/profiles/{profile_id}",
-            params=path_params,
         )
 
         return
@@ -109,25 +81,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleProfile:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "profile_id": profile_id,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/profiles/{profile_id}",
-            data=str(updatebundleprofilerequest)
-            if not issubclass(type(updatebundleprofilerequest), BaseModel)
-            else updatebundleprofilerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatebundleprofilerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleProfile, resp)
 
     async def delete_bundle_profile(
         self,
@@ -136,22 +96,11 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleProfile:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "profile_id": profile_id,
-            "domain_name": domain_name,
-        }
         resp = await self.delete(
             f"/v1/domains/{domain_name}/bundles/profiles/{profile_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleProfile, resp)
 
     async def get_bundle_events(
         self,
@@ -165,23 +114,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/bundles/events/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageBundleEventModel.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageBundleEventModel, resp)
 
     async def get_bundle_event(
         self,
@@ -193,23 +131,11 @@ class ResourceClient(Client):
         Gets a bundle by its database UUID
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "event_id": event_id,
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/bundles/{uid}/events/{event_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def get_bundles(
         self,
@@ -223,20 +149,11 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/v1/domains/{domain_name}/bundles/", params=path_params | query_params
+            f"/v1/domains/{domain_name}/bundles/", params=query_params
         )
 
-        try:
-            resp_model = resource_schemas.PageResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageResourceBundle, resp)
 
     async def create_bundle(
         self,
@@ -245,24 +162,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.ResourceBundle:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/bundles/",
-            data=str(createresourcebundlerequest)
-            if not issubclass(type(createresourcebundlerequest), BaseModel)
-            else createresourcebundlerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createresourcebundlerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def get_bundle(
         self,
@@ -273,21 +179,9 @@ class ResourceClient(Client):
         Gets a bundle by its database UUID
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/v1/domains/{domain_name}/bundles/{uid}", params=path_params
-        )
+        resp = await self.get(f"/v1/domains/{domain_name}/bundles/{uid}")
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def update_bundle(
         self,
@@ -297,25 +191,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.ResourceBundle:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/{uid}",
-            data=str(updateresourcebundlerequest)
-            if not issubclass(type(updateresourcebundlerequest), BaseModel)
-            else updateresourcebundlerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updateresourcebundlerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def remove_bundle(
         self,
@@ -327,21 +209,9 @@ class ResourceClient(Client):
         The bundle must already be in an unpublished state otherwise an error will be raised.
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
-        resp = await self.delete(
-            f"/v1/domains/{domain_name}/bundles/{uid}", params=path_params
-        )
+        resp = await self.delete(f"/v1/domains/{domain_name}/bundles/{uid}")
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_bundle_version(
         self,
@@ -353,23 +223,11 @@ class ResourceClient(Client):
         Gets a bundle version.
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "version": version,
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/bundles/{uid}/versions/{version}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleManifest.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleManifest, resp)
 
     async def set_bundle_version(
         self,
@@ -381,23 +239,11 @@ class ResourceClient(Client):
         Sets a bundle draft version.
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "version": version,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/{uid}/versions/{version}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def remove_bundle_version(
         self,
@@ -409,23 +255,11 @@ class ResourceClient(Client):
         Removes a bundle version. It must not be a draft or current version.
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "version": version,
-            "domain_name": domain_name,
-        }
         resp = await self.delete(
             f"/v1/domains/{domain_name}/bundles/{uid}/versions/{version}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def create_tree_bundle(
         self,
@@ -434,24 +268,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/bundles/tree/",
-            data=str(createtreebundlerequest)
-            if not issubclass(type(createtreebundlerequest), BaseModel)
-            else createtreebundlerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createtreebundlerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_tree(
         self,
@@ -460,21 +283,9 @@ class ResourceClient(Client):
     ) -> resource_schemas.MerkleTreeModel:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/v1/domains/{domain_name}/bundles/{uid}/tree/", params=path_params
-        )
+        resp = await self.get(f"/v1/domains/{domain_name}/bundles/{uid}/tree/")
 
-        try:
-            resp_model = resource_schemas.MerkleTreeModel.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.MerkleTreeModel, resp)
 
     async def update_tree_bundle(
         self,
@@ -484,25 +295,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/{uid}/tree/",
-            data=str(updatetreebundlerequest)
-            if not issubclass(type(updatetreebundlerequest), BaseModel)
-            else updatetreebundlerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatetreebundlerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_tree_proof(
         self,
@@ -512,25 +311,13 @@ class ResourceClient(Client):
     ) -> Union[object, list]:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/bundles/{uid}/tree/proof/",
-            data=str(treeproofcreation)
-            if not issubclass(type(treeproofcreation), BaseModel)
-            else treeproofcreation.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(treeproofcreation),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = Union[object, list].model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._parse_json(resp)
 
     async def tree_validate(
         self,
@@ -540,27 +327,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.TreeProofValidationOutput:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/{uid}/tree/proof/",
-            data=str(treeproofvalidationinput)
-            if not issubclass(type(treeproofvalidationinput), BaseModel)
-            else treeproofvalidationinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(treeproofvalidationinput),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.TreeProofValidationOutput.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.TreeProofValidationOutput, resp)
 
     async def add_policy(
         self,
@@ -570,25 +343,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.Policy:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/bundles/{uid}/policies/",
-            data=str(policy)
-            if not issubclass(type(policy), BaseModel)
-            else policy.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(policy),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Policy.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Policy, resp)
 
     async def update_policy(
         self,
@@ -598,25 +359,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.Policy:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/{uid}/policies/",
-            data=str(policy)
-            if not issubclass(type(policy), BaseModel)
-            else policy.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(policy),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Policy.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Policy, resp)
 
     async def remove_policy(
         self,
@@ -626,23 +375,11 @@ class ResourceClient(Client):
     ) -> resource_schemas.Policy:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "identifier": identifier,
-            "domain_name": domain_name,
-        }
         resp = await self.delete(
             f"/v1/domains/{domain_name}/bundles/{uid}/policies/{identifier}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.Policy.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Policy, resp)
 
     async def upload_files(
         self,
@@ -652,25 +389,14 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        upload_file = {"files": open(file_url, "rb")}
-
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
-        resp = await self.put(
-            f"/v1/domains/{domain_name}/bundles/{uid}/files/upload/",
-            upload_file=upload_file,
-            params=path_params,
-        )
-
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
+        # httpx streams the open file in chunks, close it once the upload is sent
+        with open(file_url, "rb") as upload:
+            resp = await self.put(
+                f"/v1/domains/{domain_name}/bundles/{uid}/files/upload/",
+                upload_file={"files": upload},
             )
-        return resp_model
+
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def edit_files(
         self,
@@ -680,25 +406,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/{uid}/files/edit/",
-            data=str(updatebundlefilesrequest)
-            if not issubclass(type(updatebundlefilesrequest), BaseModel)
-            else updatebundlefilesrequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatebundlefilesrequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_task(
         self,
@@ -708,23 +422,11 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "task_id": task_id,
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/bundles/{uid}/tasks/{task_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def update_task(
         self,
@@ -735,26 +437,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "task_id": task_id,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/{uid}/tasks/{task_id}",
-            data=str(updatebundletask)
-            if not issubclass(type(updatebundletask), BaseModel)
-            else updatebundletask.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatebundletask),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_tasks(
         self,
@@ -769,22 +458,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/bundles/{uid}/tasks/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageBundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageBundleTask, resp)
 
     async def propose_transfer(
         self,
@@ -794,25 +473,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.Transfer:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/bundles/{uid}/transfers/",
-            data=str(proposetransferrequest)
-            if not issubclass(type(proposetransferrequest), BaseModel)
-            else proposetransferrequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(proposetransferrequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Transfer.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Transfer, resp)
 
     async def get_transfer(
         self,
@@ -828,23 +495,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "transfer_id": transfer_id,
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/bundles/{uid}/transfers/{transfer_id}",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.Transfer.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Transfer, resp)
 
     async def update_transfer(
         self,
@@ -881,26 +537,14 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "transfer_id": transfer_id,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/{uid}/transfers/{transfer_id}",
-            data=str(updatetransferrequest)
-            if not issubclass(type(updatetransferrequest), BaseModel)
-            else updatetransferrequest.model_dump_json(),  # type: ignore
-            params=path_params | query_params,
+            content=dump_model(updatetransferrequest),
+            headers=JSON_HEADERS,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.Transfer.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Transfer, resp)
 
     async def get_transfers(
         self,
@@ -914,21 +558,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/bundles/transfers/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageTransfer.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageTransfer, resp)
 
     async def publish_action(
         self,
@@ -938,25 +573,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/bundles/{uid}/publish/",
-            data=str(publicationrequest)
-            if not issubclass(type(publicationrequest), BaseModel)
-            else publicationrequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(publicationrequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_storages(
         self,
@@ -970,20 +593,11 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
-            f"/v1/domains/{domain_name}/storages/", params=path_params | query_params
+            f"/v1/domains/{domain_name}/storages/", params=query_params
         )
 
-        try:
-            resp_model = resource_schemas.PageStorageView.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageStorageView, resp)
 
     async def create_storage(
         self,
@@ -1004,24 +618,13 @@ class ResourceClient(Client):
         Supported adapters are available at the
         """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/storages/",
-            data=str(createstoragerequest)
-            if not issubclass(type(createstoragerequest), BaseModel)
-            else createstoragerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createstoragerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Storage.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Storage, resp)
 
     async def get_storage(
         self,
@@ -1030,21 +633,9 @@ class ResourceClient(Client):
     ) -> resource_schemas.Storage:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "name": name,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/v1/domains/{domain_name}/storages/{name}", params=path_params
-        )
+        resp = await self.get(f"/v1/domains/{domain_name}/storages/{name}")
 
-        try:
-            resp_model = resource_schemas.Storage.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Storage, resp)
 
     async def update_storage(
         self,
@@ -1054,25 +645,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.Storage:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "name": name,
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/storages/{name}",
-            data=str(updatestoragerequest)
-            if not issubclass(type(updatestoragerequest), BaseModel)
-            else updatestoragerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatestoragerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Storage.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Storage, resp)
 
     async def get_storage_type_views(
         self,
@@ -1086,23 +665,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/storages/storage_types/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageStorageTypeView.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageStorageTypeView, resp)
 
     async def get_org_bundle_profiles(
         self,
@@ -1117,22 +685,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/profiles/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageBundleProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageBundleProfile, resp)
 
     async def create_org_bundle_profile(
         self,
@@ -1142,25 +700,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleProfile:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/profiles/",
-            data=str(bundleprofilerequest)
-            if not issubclass(type(bundleprofilerequest), BaseModel)
-            else bundleprofilerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(bundleprofilerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleProfile, resp)
 
     async def get_org_bundle_profile(
         self,
@@ -1172,23 +718,11 @@ class ResourceClient(Client):
         Gets a bundle by its database UUID
         """
 
-        path_params: Dict[str, Any] = {
-            "profile_id": profile_id,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/profiles/{profile_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleProfile, resp)
 
     async def update_org_bundle_profile(
         self,
@@ -1199,26 +733,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleProfile:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "profile_id": profile_id,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/profiles/{profile_id}",
-            data=str(updatebundleprofilerequest)
-            if not issubclass(type(updatebundleprofilerequest), BaseModel)
-            else updatebundleprofilerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatebundleprofilerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleProfile, resp)
 
     async def delete_org_bundle_profile(
         self,
@@ -1228,23 +749,11 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleProfile:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "profile_id": profile_id,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.delete(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/profiles/{profile_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleProfile.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleProfile, resp)
 
     async def get_org_bundle_events(
         self,
@@ -1259,24 +768,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/events/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageBundleEventModel.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageBundleEventModel, resp)
 
     async def get_org_bundle_event(
         self,
@@ -1289,24 +786,11 @@ class ResourceClient(Client):
         Gets a bundle by its database UUID
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "event_id": event_id,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/events/{event_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def get_org_bundles(
         self,
@@ -1321,22 +805,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageResourceBundle, resp)
 
     async def create_org_bundle(
         self,
@@ -1346,25 +820,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.ResourceBundle:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/",
-            data=str(createresourcebundlerequest)
-            if not issubclass(type(createresourcebundlerequest), BaseModel)
-            else createresourcebundlerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createresourcebundlerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def get_org_bundle(
         self,
@@ -1376,23 +838,11 @@ class ResourceClient(Client):
         Gets a bundle by its database UUID
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def update_org_bundle(
         self,
@@ -1403,26 +853,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.ResourceBundle:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}",
-            data=str(updateresourcebundlerequest)
-            if not issubclass(type(updateresourcebundlerequest), BaseModel)
-            else updateresourcebundlerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updateresourcebundlerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def remove_org_bundle(
         self,
@@ -1435,23 +872,11 @@ class ResourceClient(Client):
         The bundle must already be in an unpublished state otherwise an error will be raised.
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.delete(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def create_org_tree_bundle(
         self,
@@ -1461,25 +886,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/tree/",
-            data=str(createtreebundlerequest)
-            if not issubclass(type(createtreebundlerequest), BaseModel)
-            else createtreebundlerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createtreebundlerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_org_tree(
         self,
@@ -1489,23 +902,11 @@ class ResourceClient(Client):
     ) -> resource_schemas.MerkleTreeModel:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/tree/",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.MerkleTreeModel.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.MerkleTreeModel, resp)
 
     async def update_org_tree_bundle(
         self,
@@ -1516,26 +917,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/tree/",
-            data=str(updatetreebundlerequest)
-            if not issubclass(type(updatetreebundlerequest), BaseModel)
-            else updatetreebundlerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatetreebundlerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_org_tree_proof(
         self,
@@ -1546,26 +934,13 @@ class ResourceClient(Client):
     ) -> Union[object, list]:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/tree/proof/",
-            data=str(treeproofcreation)
-            if not issubclass(type(treeproofcreation), BaseModel)
-            else treeproofcreation.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(treeproofcreation),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = Union[object, list].model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._parse_json(resp)
 
     async def org_tree_validate(
         self,
@@ -1576,28 +951,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.TreeProofValidationOutput:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/tree/proof/",
-            data=str(treeproofvalidationinput)
-            if not issubclass(type(treeproofvalidationinput), BaseModel)
-            else treeproofvalidationinput.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(treeproofvalidationinput),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.TreeProofValidationOutput.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.TreeProofValidationOutput, resp)
 
     async def get_org_bundle_version(
         self,
@@ -1610,24 +970,11 @@ class ResourceClient(Client):
         Gets a bundle version.
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "version": version,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/versions/{version}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleManifest.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleManifest, resp)
 
     async def set_org_bundle_version(
         self,
@@ -1640,24 +987,11 @@ class ResourceClient(Client):
         Sets a bundle draft version.
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "version": version,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/versions/{version}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceBundle, resp)
 
     async def remove_org_bundle_version(
         self,
@@ -1670,24 +1004,11 @@ class ResourceClient(Client):
         Removes a bundle version. It must not be a draft or current version.
         """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "version": version,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.delete(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/versions/{version}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def add_org_policy(
         self,
@@ -1698,26 +1019,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.Policy:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/policies/",
-            data=str(policy)
-            if not issubclass(type(policy), BaseModel)
-            else policy.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(policy),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Policy.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Policy, resp)
 
     async def update_org_policy(
         self,
@@ -1728,26 +1036,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.Policy:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/policies/",
-            data=str(policy)
-            if not issubclass(type(policy), BaseModel)
-            else policy.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(policy),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Policy.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Policy, resp)
 
     async def remove_org_policy(
         self,
@@ -1758,24 +1053,11 @@ class ResourceClient(Client):
     ) -> resource_schemas.Policy:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "identifier": identifier,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.delete(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/policies/{identifier}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.Policy.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Policy, resp)
 
     async def upload_org_files(
         self,
@@ -1786,26 +1068,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        upload_file = {"files": open(file_url, "rb")}
-
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
-        resp = await self.put(
-            f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/files/upload/",
-            upload_file=upload_file,
-            params=path_params,
-        )
-
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
+        with open(file_url, "rb") as upload:
+            resp = await self.put(
+                f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/files/upload/",
+                upload_file={"files": upload},
             )
-        return resp_model
+
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def edit_org_files(
         self,
@@ -1816,26 +1085,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/files/edit/",
-            data=str(updatebundlefilesrequest)
-            if not issubclass(type(updatebundlefilesrequest), BaseModel)
-            else updatebundlefilesrequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatebundlefilesrequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_org_task(
         self,
@@ -1846,24 +1102,11 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "task_id": task_id,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/tasks/{task_id}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def update_org_task(
         self,
@@ -1875,27 +1118,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "task_id": task_id,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/tasks/{task_id}",
-            data=str(updatebundletask)
-            if not issubclass(type(updatebundletask), BaseModel)
-            else updatebundletask.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatebundletask),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def get_org_tasks(
         self,
@@ -1911,23 +1140,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/tasks/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageBundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageBundleTask, resp)
 
     async def publish_org_action(
         self,
@@ -1938,26 +1156,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.BundleTask:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/publish/",
-            data=str(publicationrequest)
-            if not issubclass(type(publicationrequest), BaseModel)
-            else publicationrequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(publicationrequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.BundleTask.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.BundleTask, resp)
 
     async def propose_org_transfer(
         self,
@@ -1968,26 +1173,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.Transfer:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/transfers/",
-            data=str(proposetransferrequest)
-            if not issubclass(type(proposetransferrequest), BaseModel)
-            else proposetransferrequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(proposetransferrequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Transfer.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Transfer, resp)
 
     async def get_org_transfer(
         self,
@@ -2004,24 +1196,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "transfer_id": transfer_id,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/transfers/{transfer_id}",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.Transfer.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Transfer, resp)
 
     async def update_org_transfer(
         self,
@@ -2059,27 +1239,14 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "uid": uid,
-            "transfer_id": transfer_id,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/{uid}/transfers/{transfer_id}",
-            data=str(updatetransferrequest)
-            if not issubclass(type(updatetransferrequest), BaseModel)
-            else updatetransferrequest.model_dump_json(),  # type: ignore
-            params=path_params | query_params,
+            content=dump_model(updatetransferrequest),
+            headers=JSON_HEADERS,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.Transfer.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Transfer, resp)
 
     async def get_org_transfers(
         self,
@@ -2094,22 +1261,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/bundles/transfers/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageTransfer.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageTransfer, resp)
 
     async def get_org_storages(
         self,
@@ -2124,22 +1281,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/storages/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PageStorageView.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageStorageView, resp)
 
     async def create_org_storage(
         self,
@@ -2161,25 +1308,13 @@ class ResourceClient(Client):
         Supported adapters are available at the
         """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/storages/",
-            data=str(createstoragerequest)
-            if not issubclass(type(createstoragerequest), BaseModel)
-            else createstoragerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createstoragerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Storage.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Storage, resp)
 
     async def get_org_storage(
         self,
@@ -2189,23 +1324,11 @@ class ResourceClient(Client):
     ) -> resource_schemas.Storage:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "name": name,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/storages/{name}",
-            params=path_params,
         )
 
-        try:
-            resp_model = resource_schemas.Storage.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Storage, resp)
 
     async def update_org_storage(
         self,
@@ -2216,26 +1339,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.Storage:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "name": name,
-            "domain_name": domain_name,
-            "organisation_name": organisation_name,
-        }
         resp = await self.put(
             f"/v1/domains/{domain_name}/organisations/{organisation_name}/storages/{name}",
-            data=str(updatestoragerequest)
-            if not issubclass(type(updatestoragerequest), BaseModel)
-            else updatestoragerequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatestoragerequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Storage.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Storage, resp)
 
     async def get_schema_data(
         self,
@@ -2250,24 +1360,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "name": name,
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/domains/{domain_name}/schemas/name/{name}",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.InternalSchemaModel.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.InternalSchemaModel, resp)
 
     async def upsert_schema_data(
         self,
@@ -2277,25 +1375,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.SchemaEditResponse:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "name": name,
-            "domain_name": domain_name,
-        }
         resp = await self.post(
             f"/v1/domains/{domain_name}/schemas/name/{name}",
-            data=str(schemasetrequest)
-            if not issubclass(type(schemasetrequest), BaseModel)
-            else schemasetrequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(schemasetrequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.SchemaEditResponse.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.SchemaEditResponse, resp)
 
     async def delete_schema_data(
         self,
@@ -2304,21 +1390,9 @@ class ResourceClient(Client):
     ) -> resource_schemas.SchemaEditResponse:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "name": name,
-            "domain_name": domain_name,
-        }
-        resp = await self.delete(
-            f"/v1/domains/{domain_name}/schemas/name/{name}", params=path_params
-        )
+        resp = await self.delete(f"/v1/domains/{domain_name}/schemas/name/{name}")
 
-        try:
-            resp_model = resource_schemas.SchemaEditResponse.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.SchemaEditResponse, resp)
 
     async def get_schema_data_by_id(
         self,
@@ -2327,23 +1401,9 @@ class ResourceClient(Client):
     ) -> resource_schemas.InternalSchemaModel:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "schema_id": schema_id,
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/v1/domains/{domain_name}/schemas/{schema_id}", params=path_params
-        )
+        resp = await self.get(f"/v1/domains/{domain_name}/schemas/{schema_id}")
 
-        try:
-            resp_model = resource_schemas.InternalSchemaModel.model_validate(
-                resp.json()
-            )
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.InternalSchemaModel, resp)
 
     async def get_version(
         self,
@@ -2352,11 +1412,9 @@ class ResourceClient(Client):
         Returns the version of the code running.
         """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/v1/version/", params=path_params)
+        resp = await self.get("/v1/version/")
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def suspend_external(
         self,
@@ -2366,17 +1424,13 @@ class ResourceClient(Client):
         Suspends or resumes the external process service.
         """
 
-        path_params: Dict[str, Any] = {}
         resp = await self.put(
             "/v1/external/",
-            data=str(suspendexternalprocessmanagement)
-            if not issubclass(type(suspendexternalprocessmanagement), BaseModel)
-            else suspendexternalprocessmanagement.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(suspendexternalprocessmanagement),
+            headers=JSON_HEADERS,
         )
 
-        resp_model = str(resp.json())  # type: ignore
-        return resp_model
+        return self._parse_str(resp)
 
     async def get_domains(
         self,
@@ -2391,16 +1445,9 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/v1/domains/", params=path_params | query_params)
+        resp = await self.get("/v1/domains/", params=query_params)
 
-        try:
-            resp_model = resource_schemas.PageDomain.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageDomain, resp)
 
     async def create_domain(
         self,
@@ -2412,22 +1459,13 @@ class ResourceClient(Client):
         This is deprecated and delegated to the Member Service.
         """
 
-        path_params: Dict[str, Any] = {}
         resp = await self.post(
             "/v1/domains/",
-            data=str(createdomain)
-            if not issubclass(type(createdomain), BaseModel)
-            else createdomain.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createdomain),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.Domain.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.Domain, resp)
 
     async def get_domain_configuration(
         self,
@@ -2435,20 +1473,9 @@ class ResourceClient(Client):
     ) -> resource_schemas.AdminDomain:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
-        resp = await self.get(
-            f"/v1/configuration/domains/{domain_name}", params=path_params
-        )
+        resp = await self.get(f"/v1/configuration/domains/{domain_name}")
 
-        try:
-            resp_model = resource_schemas.AdminDomain.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.AdminDomain, resp)
 
     async def configure_domain(
         self,
@@ -2457,24 +1484,13 @@ class ResourceClient(Client):
     ) -> resource_schemas.AdminDomain:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.put(
             f"/v1/configuration/domains/{domain_name}",
-            data=str(domainconfigurationrequest)
-            if not issubclass(type(domainconfigurationrequest), BaseModel)
-            else domainconfigurationrequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(domainconfigurationrequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.AdminDomain.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.AdminDomain, resp)
 
     async def get_organisations(
         self,
@@ -2489,16 +1505,9 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/v1/organisations/", params=path_params | query_params)
+        resp = await self.get("/v1/organisations/", params=query_params)
 
-        try:
-            resp_model = resource_schemas.PageOrganisation.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageOrganisation, resp)
 
     async def get_storage_types(
         self,
@@ -2514,16 +1523,9 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/v1/storage_types/", params=path_params | query_params)
+        resp = await self.get("/v1/storage_types/", params=query_params)
 
-        try:
-            resp_model = resource_schemas.PageStorageType.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageStorageType, resp)
 
     async def create_storage_type(
         self,
@@ -2533,22 +1535,13 @@ class ResourceClient(Client):
         Create storage type.
         """
 
-        path_params: Dict[str, Any] = {}
         resp = await self.post(
             "/v1/storage_types/",
-            data=str(createstoragetype)
-            if not issubclass(type(createstoragetype), BaseModel)
-            else createstoragetype.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(createstoragetype),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.StorageType.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.StorageType, resp)
 
     async def get_storage_type(
         self,
@@ -2558,18 +1551,9 @@ class ResourceClient(Client):
         Gets a storage type.
         """
 
-        path_params: Dict[str, Any] = {
-            "name": name,
-        }
-        resp = await self.get(f"/v1/storage_types/{name}", params=path_params)
+        resp = await self.get(f"/v1/storage_types/{name}")
 
-        try:
-            resp_model = resource_schemas.StorageType.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.StorageType, resp)
 
     async def update_storage_type(
         self,
@@ -2580,24 +1564,13 @@ class ResourceClient(Client):
         Update a storage type
         """
 
-        path_params: Dict[str, Any] = {
-            "name": name,
-        }
         resp = await self.put(
             f"/v1/storage_types/{name}",
-            data=str(updatestoragetyperequest)
-            if not issubclass(type(updatestoragetyperequest), BaseModel)
-            else updatestoragetyperequest.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dump_model(updatestoragetyperequest),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.StorageType.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.StorageType, resp)
 
     async def get_users(
         self,
@@ -2614,16 +1587,9 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/v1/users/", params=path_params | query_params)
+        resp = await self.get("/v1/users/", params=query_params)
 
-        try:
-            resp_model = resource_schemas.PageUser.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PageUser, resp)
 
     async def request_access(
         self,
@@ -2635,24 +1601,13 @@ class ResourceClient(Client):
         The token may take a little time to become active.
         """
 
-        path_params: Dict[str, Any] = {
-            "resource_id": resource_id,
-        }
         resp = await self.post(
             f"/v1/access/bundles/{resource_id}",
-            data=str(body)
-            if not issubclass(type(body), BaseModel)
-            else body.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dumps(body),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceToken.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceToken, resp)
 
     async def get_access(
         self,
@@ -2660,10 +1615,7 @@ class ResourceClient(Client):
     ) -> bytes:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "token": token,
-        }
-        resp = await self.get(f"/v1/access/bundles/{token}", params=path_params)
+        resp = await self.get(f"/v1/access/bundles/{token}")
 
         resp_model = bytes(resp.content)  # type: ignore
         return resp_model
@@ -2674,18 +1626,9 @@ class ResourceClient(Client):
     ) -> resource_schemas.ResourceToken:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "token": token,
-        }
-        resp = await self.get(f"/v1/access/tokens/{token}", params=path_params)
+        resp = await self.get(f"/v1/access/tokens/{token}")
 
-        try:
-            resp_model = resource_schemas.ResourceToken.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceToken, resp)
 
     async def browse_bundles(
         self,
@@ -2699,21 +1642,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/access/domains/{domain_name}/bundles/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PagePublicBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PagePublicBundle, resp)
 
     async def request_public_access(
         self,
@@ -2725,24 +1659,13 @@ class ResourceClient(Client):
         The token may take a little time to become active.
         """
 
-        path_params: Dict[str, Any] = {
-            "resource_id": resource_id,
-        }
         resp = await self.post(
             f"/v1/public/bundles/{resource_id}",
-            data=str(body)
-            if not issubclass(type(body), BaseModel)
-            else body.model_dump_json(),  # type: ignore
-            params=path_params,
+            content=dumps(body),
+            headers=JSON_HEADERS,
         )
 
-        try:
-            resp_model = resource_schemas.ResourceToken.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceToken, resp)
 
     async def get_public_access(
         self,
@@ -2750,10 +1673,7 @@ class ResourceClient(Client):
     ) -> None:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "token": token,
-        }
-        await self.get(f"/v1/public/bundles/{token}", params=path_params)
+        await self.get(f"/v1/public/bundles/{token}")
 
         return
 
@@ -2763,18 +1683,9 @@ class ResourceClient(Client):
     ) -> resource_schemas.ResourceToken:
         """ """
 
-        path_params: Dict[str, Any] = {
-            "token": token,
-        }
-        resp = await self.get(f"/v1/public/tokens/{token}", params=path_params)
+        resp = await self.get(f"/v1/public/tokens/{token}")
 
-        try:
-            resp_model = resource_schemas.ResourceToken.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.ResourceToken, resp)
 
     async def browse_public_bundles(
         self,
@@ -2788,21 +1699,12 @@ class ResourceClient(Client):
             k: v for k, v in asdict(query_arguments).items() if v is not None
         }
 
-        path_params: Dict[str, Any] = {
-            "domain_name": domain_name,
-        }
         resp = await self.get(
             f"/v1/public/domains/{domain_name}/bundles/",
-            params=path_params | query_params,
+            params=query_params,
         )
 
-        try:
-            resp_model = resource_schemas.PagePublicBundle.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PagePublicBundle, resp)
 
     async def get_redactable(
         self,
@@ -2811,10 +1713,9 @@ class ResourceClient(Client):
         Returns possible redactable fields of a public bundle.
         """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/v1/public/redactable_fields/", params=path_params)
+        resp = await self.get("/v1/public/redactable_fields/")
 
-        resp_model = list(resp.json())  # type: ignore
+        resp_model = list(self._parse_json(resp))  # type: ignore
         return resp_model
 
     async def get_tree_info(
@@ -2824,16 +1725,9 @@ class ResourceClient(Client):
         Returns the tree types and their supported proof serialization types.
         """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/v1/public/tree_info/", params=path_params)
+        resp = await self.get("/v1/public/tree_info/")
 
-        try:
-            resp_model = object.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._parse_json(resp)
 
     async def health(
         self,
@@ -2842,29 +1736,15 @@ class ResourceClient(Client):
         Returns a status response.
         """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/healthz/", params=path_params)
+        resp = await self.get("/healthz/")
 
-        try:
-            resp_model = object.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._parse_json(resp)
 
     async def ping(
         self,
     ) -> resource_schemas.PingResponses:
         """ """
 
-        path_params: Dict[str, Any] = {}
-        resp = await self.get("/pingz/", params=path_params)
+        resp = await self.get("/pingz/")
 
-        try:
-            resp_model = resource_schemas.PingResponses.model_validate(resp.json())
-        except pydantic_core.ValidationError:
-            raise EnsureException(
-                f"The response came back in an unexpected format: {resp.text}"
-            )
-        return resp_model
+        return self._validate(resource_schemas.PingResponses, resp)
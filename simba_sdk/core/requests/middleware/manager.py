@@ -1,5 +1,6 @@
+import functools
 from abc import ABC
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 import httpx
 from typing_extensions import Self
@@ -9,6 +10,13 @@ class BaseMiddleware(ABC):
     client: httpx.AsyncClient
     next: Optional[Self]
 
+    def prepare(self, request: httpx.Request) -> httpx.Request:
+        """
+        Transform the request before it is sent, for changes that don't need the response.
+        Streamed requests only go through this step, not `send`.
+        """
+        return request
+
     async def send(
         self, request: httpx.Request, transport: httpx.AsyncBaseTransport
     ) -> httpx.Response:
@@ -26,18 +34,49 @@ class MiddlewareManager:
     current: Optional[BaseMiddleware] = None
 
     def add_middleware(self, middleware: BaseMiddleware) -> None:
-        if self.start is None:
+        middleware.next = None
+        if self.start is None or self.current is None:
             self.start = middleware
-            self.start.next = None
-            self.current = middleware
         else:
-            self.start.next = middleware
-            self.current = middleware
+            self.current.next = middleware
+        self.current = middleware
 
     async def send(
         self, request: httpx.Request, transport: httpx.AsyncBaseTransport
     ) -> httpx.Response:
-        if not self.current:
+        if not self.start:
             raise LookupError("Please first register a middleware.")
-        resp: httpx.Response = await self.current.send(request, transport)
+        resp: httpx.Response = await self.start.send(request, transport)
         return resp
+
+    def prepare(self, request: httpx.Request) -> httpx.Request:
+        """
+        Apply the `prepare` step of every registered middleware, in order.
+        """
+        middleware = self.start
+        while middleware is not None:
+            request = middleware.prepare(request)
+            middleware = middleware.next
+        return request
+
+    def compile(
+        self, client: httpx.AsyncClient, transport: httpx.AsyncBaseTransport
+    ) -> Callable[[httpx.Request], Awaitable[httpx.Response]]:
+        """
+        Resolve the middleware chain once into a single `send(request)` callable.
+        With no middleware registered this sends straight through `client`, unless middleware is added later.
+        """
+        if not self.start:
+            return functools.partial(self._send_direct, client, transport)
+        return functools.partial(self.start.send, transport=transport)
+
+    async def _send_direct(
+        self,
+        client: httpx.AsyncClient,
+        transport: httpx.AsyncBaseTransport,
+        request: httpx.Request,
+    ) -> httpx.Response:
+        # middleware can still be added to the manager after it was compiled
+        if self.start:
+            return await self.start.send(request, transport)
+        return await client.send(request)
@@ -29,12 +29,23 @@ class UrlAppendTrailingSlashHandler(BaseMiddleware):
         Returns:
             Response: The response object.
         """
+        response: httpx.Response = await super().send(self.prepare(request), transport)
+        return response
+
+    def prepare(self, request: httpx.Request) -> httpx.Request:
+        """Append a trailing slash to the path of a GET request
+
+        Args:
+            request (httpx.Request): The prepared request object
+
+        Returns:
+            Request: The same request, with its url updated.
+        """
         if request.method == "GET":
             if request.url.path[-1] != "/":
                 url_string: str = self.append_trailing_slash(str(request.url))
                 request.url = httpx.URL(url_string)
-        response: httpx.Response = await super().send(request, transport)
-        return response
+        return request
 
     @staticmethod
     def append_trailing_slash(url_str: str) -> str:
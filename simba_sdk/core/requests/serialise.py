@@ -0,0 +1,114 @@
+"""
+JSON (de)serialisation helpers shared by the clients. orjson is used when it is installed, and msgspec
+Structs are encoded with msgspec's own encoder when it is.
+"""
+
+import types
+from inspect import isclass
+from typing import Any, Type, TypeVar, Union, cast, get_args, get_origin
+
+import pydantic_core
+from pydantic import BaseModel, RootModel
+
+try:
+    from orjson import dumps as _dumps
+    from orjson import loads
+except ImportError:
+    from json import loads  # type: ignore
+
+    _dumps = pydantic_core.to_json  # type: ignore
+
+try:
+    import msgspec  # type: ignore
+except ImportError:
+    msgspec = None
+
+__all__ = ["construct", "dump_model", "dumps", "loads"]
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+# `X | Y` annotations have their own origin from 3.10
+_UNION_TYPES = {Union, getattr(types, "UnionType", Union)}
+# encoders are reusable and keep their internal buffer between calls
+_STRUCT_ENCODER = msgspec.json.Encoder() if msgspec is not None else None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialise a request body to UTF-8 JSON, ready to send as `content`. Pydantic models are dumped with
+    their own serializer, msgspec Structs with msgspec's, and strings and bytes are assumed to be JSON
+    already, so they are sent as they are.
+    """
+    if isinstance(obj, bytes):
+        return obj
+    if isinstance(obj, str):
+        return obj.encode()
+    if isinstance(obj, (bytearray, memoryview)):
+        return bytes(obj)
+    if isinstance(obj, BaseModel):
+        return dump_model(obj)
+    if _STRUCT_ENCODER is not None and isinstance(obj, msgspec.Struct):
+        return _STRUCT_ENCODER.encode(obj)
+    return _dumps(obj)
+
+
+def dump_model(model: BaseModel) -> bytes:
+    """
+    Serialise a request body that is known to be a pydantic model, skipping the type checks in `dumps`.
+    The serializer writes UTF-8 bytes directly, send them as `content` so httpx doesn't encode them again.
+    The output is the same as `model_dump_json()`, fields are named, not aliased.
+    """
+    return model.__pydantic_serializer__.to_json(model, by_alias=False)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """
+    Build any models nested in `value` according to the field annotation, other values are left as they are.
+    """
+    if value is None:
+        return None
+    if isclass(annotation) and issubclass(annotation, BaseModel):
+        return construct(annotation, value)
+    origin = get_origin(annotation)
+    if origin is None:
+        return value
+    args = get_args(annotation)
+    if origin is list and isinstance(value, list) and args:
+        return [_construct_value(args[0], item) for item in value]
+    if origin is dict and isinstance(value, dict) and len(args) == 2:
+        return {key: _construct_value(args[1], item) for key, item in value.items()}
+    if origin in _UNION_TYPES:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            return _construct_value(members[0], value)
+        # otherwise pick the first member that fits the shape of the value
+        for arg in members:
+            if isinstance(value, dict) and isclass(arg) and issubclass(arg, BaseModel):
+                return construct(arg, value)
+            if isinstance(value, list) and get_origin(arg) is list:
+                return _construct_value(arg, value)
+    return value
+
+
+def construct(model: Type[ModelT], data: Any) -> ModelT:
+    """
+    Build `model` from already validated data without validating it again, nested models included.
+    Values are not coerced, e.g. datetimes, UUIDs and enums are left as the strings the server sent,
+    so only use this for responses from a trusted server.
+    """
+    if issubclass(model, RootModel):
+        return cast(
+            ModelT,
+            model.model_construct(
+                _construct_value(model.model_fields["root"].annotation, data)
+            ),
+        )
+    if not isinstance(data, dict):
+        raise TypeError(
+            f"Expected an object for {model.__name__}, got {type(data).__name__}"
+        )
+    values = dict(data)
+    for name, field in model.model_fields.items():
+        key = field.alias if field.alias and field.alias in values else name
+        if key in values:
+            values[key] = _construct_value(field.annotation, values[key])
+    return model.model_construct(**values)
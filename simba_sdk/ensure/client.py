@@ -1,4 +1,5 @@
-from typing import IO, Any, Callable, Optional, Union
+from types import TracebackType
+from typing import IO, Any, Callable, Optional, Tuple, Type, Union
 
 import simba_sdk.core.requests.client.credential.queries as credential_queries
 import simba_sdk.core.requests.client.credential.schemas as credential_schemas
@@ -9,6 +10,7 @@ import simba_sdk.core.requests.client.resource.schemas as resource_schemas
 from simba_sdk import config
 from simba_sdk.config import settings
 from simba_sdk.core.requests.auth.token_store import InMemoryTokenStore
+from simba_sdk.core.requests.client.base import Client
 from simba_sdk.core.requests.client.credential.client import CredentialClient
 from simba_sdk.core.requests.client.members.client import MembersClient
 from simba_sdk.core.requests.client.resource.client import ResourceClient
@@ -47,11 +49,36 @@ class EnsureClient:
             settings.RESOURCE_URL, token_store=self._token_store
         )
 
+    async def __aenter__(self) -> "EnsureClient":
+        # built inside a running event loop, the service clients share that loop's pooled AsyncClient; entering and
+        # exiting leaves it open, so release it with `close_default_clients()` from
+        # simba_sdk.core.requests.client.base. Built outside a loop, each service client has a private AsyncClient
+        # which __aexit__ closes
+        for client in self._clients:
+            await client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        for client in self._clients:
+            await client.__aexit__(exc_type, exc_val, exc_tb)  # type: ignore
+
+    @property
+    def _clients(self) -> Tuple[Client, ...]:
+        return self.members_client, self.credential_client, self.resource_client
+
     async def authorise(self) -> None:
         try:
-            if not self._authorised or self._token_store.is_expired_token(
+            expired = self._authorised and self._token_store.is_expired_token(
                 settings.CLIENT_ID
-            ):
+            )
+            if not isinstance(expired, bool):
+                expired = await expired
+            if not self._authorised or expired:
                 await self.members_client.authorise()
                 self._authorised = True
         except RequestException as ex: